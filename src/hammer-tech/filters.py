@@ -8,7 +8,7 @@
 
 import os
 import warnings
-from typing import TYPE_CHECKING, Any, Callable, List
+from typing import TYPE_CHECKING, Any, Callable, List, Union, overload
 
 from library_filter import LibraryFilter
 
@@ -17,6 +17,32 @@ if TYPE_CHECKING:
     from library_filter import Library
 
 
+class cached_filter:
+    """
+    Decorator for LibraryFilterHolder filters: build the LibraryFilter on the first access and return the same
+    (immutable) filter on subsequent accesses instead of re-creating and re-checking its functions every time.
+    The filter is stored on the holder instance, which then shadows this (non-data) descriptor.
+    """
+
+    def __init__(self, func: Callable[[Any], LibraryFilter]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+        self.name = func.__name__
+
+    @overload
+    def __get__(self, instance: None, owner: Any) -> "cached_filter": ...
+
+    @overload
+    def __get__(self, instance: object, owner: Any) -> LibraryFilter: ...
+
+    def __get__(self, instance: Any, owner: Any) -> Union["cached_filter", LibraryFilter]:
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
 class LibraryFilterHolder:
     """
     Dummy class to hold the list of properties.
@@ -38,7 +64,7 @@ class LibraryFilterHolder:
 
         return check_nonempty
 
-    @property
+    @cached_filter
     def timing_db_filter(self) -> LibraryFilter:
         """
         Selecting Synopsys timing libraries (.db). Prefers CCS if available; picks NLDM as a fallback.
@@ -75,7 +101,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("timing_lib", "CCS/NLDM timing lib (ASCII .lib)",
                                  paths_func=paths_func, is_file=True)
 
-    @property
+    @cached_filter
     def timing_lib_filter(self) -> LibraryFilter:
         """
         Select ASCII .lib timing libraries. Prefers CCS if available; picks NLDM as a fallback.
@@ -93,7 +119,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("timing_lib", "CCS/NLDM timing lib (ASCII .lib)",
                                  paths_func=paths_func, is_file=True)
 
-    @property
+    @cached_filter
     def timing_lib_with_ecsm_filter(self) -> LibraryFilter:
         """
         Select ASCII .lib timing libraries. Prefers ECSM, then CCS, then NLDM if multiple are present for
@@ -113,7 +139,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("timing_lib_with_ecsm", "ECSM/CCS/NLDM timing lib (liberty ASCII .lib)",
                                  paths_func=paths_func, is_file=True)
 
-    @property
+    @cached_filter
     def qrc_tech_filter(self) -> LibraryFilter:
         """
         Selecting qrc RC Corner tech (qrcTech) files.
@@ -128,7 +154,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("qrc", "qrc RC corner tech file",
                                  paths_func=paths_func, is_file=True)
 
-    @property
+    @cached_filter
     def verilog_synth_filter(self) -> LibraryFilter:
         """
         Selecting verilog_synth files which are synthesizable wrappers (e.g. for SRAM) which are needed in some
@@ -144,7 +170,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("verilog_synth", "Synthesizable Verilog wrappers",
                                  paths_func=paths_func, is_file=True)
 
-    @property
+    @cached_filter
     def lef_filter(self) -> LibraryFilter:
         """
         Select LEF files for physical layout.
@@ -167,7 +193,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("lef", "LEF physical design layout library", is_file=True, filter_func=filter_func,
                                  paths_func=paths_func, sort_func=sort_func)
 
-    @property
+    @cached_filter
     def verilog_sim_filter(self) -> LibraryFilter:
         """
         Select verilog sim files for gate level simulation
@@ -182,7 +208,7 @@ class LibraryFilterHolder:
 
         return LibraryFilter.new("verilog_sim", "Gate-level verilog sources", is_file=True, filter_func=filter_func, paths_func=paths_func)
 
-    @property
+    @cached_filter
     def gds_filter(self) -> LibraryFilter:
         """
         Select GDS files for opaque physical information.
@@ -198,7 +224,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("gds", "GDS opaque physical design layout", is_file=True, filter_func=filter_func,
                                  paths_func=paths_func)
 
-    @property
+    @cached_filter
     def spice_filter(self) -> LibraryFilter:
         """
         Select SPICE files.
@@ -214,7 +240,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("spice", "SPICE files", is_file=True, filter_func=filter_func,
                                  paths_func=paths_func)
 
-    @property
+    @cached_filter
     def milkyway_lib_dir_filter(self) -> LibraryFilter:
         def select_milkyway_lib(lib: "Library") -> List[str]:
             if lib.milkyway_lib_in_dir is not None:
@@ -224,7 +250,7 @@ class LibraryFilterHolder:
 
         return LibraryFilter.new("milkyway_dir", "Milkyway lib", is_file=False, paths_func=select_milkyway_lib)
 
-    @property
+    @cached_filter
     def milkyway_techfile_filter(self) -> LibraryFilter:
         """Select milkyway techfiles."""
 
@@ -237,7 +263,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("milkyway_tf", "Milkyway techfile", is_file=True, paths_func=select_milkyway_tfs,
                                  extra_post_filter_funcs=[self.create_nonempty_check("Milkyway techfile")])
 
-    @property
+    @cached_filter
     def tlu_max_cap_filter(self) -> LibraryFilter:
         """Select TLU+ max cap files."""
 
@@ -249,7 +275,7 @@ class LibraryFilterHolder:
 
         return LibraryFilter.new("tlu_max", "TLU+ max cap db", is_file=True, paths_func=select_tlu_max_cap)
 
-    @property
+    @cached_filter
     def tlu_min_cap_filter(self) -> LibraryFilter:
         """Select TLU+ min cap files."""
 
@@ -261,7 +287,7 @@ class LibraryFilterHolder:
 
         return LibraryFilter.new("tlu_min", "TLU+ min cap db", is_file=True, paths_func=select_tlu_min_cap)
 
-    @property
+    @cached_filter
     def tlu_map_file_filter(self) -> LibraryFilter:
         """Select TLU+ map files."""
         def select_tlu_map_file(lib: "Library") -> List[str]:
@@ -271,7 +297,7 @@ class LibraryFilterHolder:
                 return []
         return LibraryFilter.new("tlu_map", "TLU+ map file", is_file=True, paths_func=select_tlu_map_file)
 
-    @property
+    @cached_filter
     def spice_model_file_filter(self) -> LibraryFilter:
         """Select spice model files."""
         def select_spice_model_file(lib: "Library") -> List[str]:
@@ -281,7 +307,7 @@ class LibraryFilterHolder:
                 return []
         return LibraryFilter.new("spice_model_file", "Spice model file", is_file=True, paths_func=select_spice_model_file)
 
-    @property
+    @cached_filter
     def spice_model_lib_corner_filter(self) -> LibraryFilter:
         """Select spice model lib corners."""
         def select_spice_model_lib_corner(lib: "Library") -> List[str]:
@@ -291,7 +317,7 @@ class LibraryFilterHolder:
                 return []
         return LibraryFilter.new("spice_model_lib_corner", "Spice model lib corner", is_file=False, paths_func=select_spice_model_lib_corner)
 
-    @property
+    @cached_filter
     def power_grid_library_filter(self) -> LibraryFilter:
         """
         Select power grid libraries for EM/IR analysis.
@@ -314,7 +340,7 @@ class LibraryFilterHolder:
         return LibraryFilter.new("power_grid_library", "Power grid library", is_file=False, filter_func=filter_func,
                                  paths_func=paths_func, sort_func=sort_func)
 
-    @property
+    @cached_filter
     def klayout_techfile_filter(self) -> LibraryFilter:
         """
         Select KLayout tech files for GDS streaming.
@@ -12,6 +12,8 @@ import sys
 import tarfile
 import importlib
 import subprocess
+from functools import lru_cache
+from itertools import chain
 from abc import ABCMeta, abstractmethod
 from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Tuple, Dict, TYPE_CHECKING
 from decimal import Decimal
@@ -21,9 +23,8 @@ import python_jsonschema_objects  # type: ignore
 
 from hammer_config import load_yaml, HammerJSONEncoder
 from hammer_logging import HammerVLSILoggingContext
-from hammer_utils import (LEFUtils, add_lists, deeplist, get_or_else,
-                          in_place_unique, optional_map, reduce_list_str,
-                          reduce_named, coerce_to_grid)
+from hammer_utils import (LEFUtils, deeplist, get_or_else,
+                          optional_map, reduce_named, coerce_to_grid)
 if TYPE_CHECKING:
     from hammer_vlsi.hooks import HammerToolHookAction
 
@@ -822,7 +823,8 @@ class HammerTechnology:
                                pre_filts: List[Callable[[Library], bool]],
                                output_func: Callable[[str, LibraryFilter], List[str]],
                                must_exist: bool = True,
-                               uniquify: bool = True) -> List[str]:
+                               uniquify: bool = True,
+                               libraries: Optional[List[Library]] = None) -> List[str]:
         """
         Process the given library filter and return a list of items from that library filter with any extra
         post-processing.
@@ -838,6 +840,7 @@ class HammerTechnology:
                             which generated it.
         :param must_exist: Must each library item actually exist? Default: True (yes, they must exist)
         :param uniquify: Must uniqify the list of output files. Default: True
+        :param libraries: Libraries to process. Default: None (use get_available_libraries())
         :return: Resultant items from the filter and post-processed. (e.g. --timing foo.db --timing bar.db)
         """
 
@@ -846,7 +849,7 @@ class HammerTechnology:
 
         filtered_libs = list(reduce_named(
             sequence=lib_filters,
-            initial=self.get_available_libraries(),
+            initial=self.get_available_libraries() if libraries is None else libraries,
             function=lambda libs, func: filter(func, libs)
         ))  # type: List[Library]
 
@@ -856,19 +859,21 @@ class HammerTechnology:
             filtered_libs = sorted(filtered_libs, key=filt.sort_func)  # type: ignore
 
         # Next, extract paths and prepend them to get the real paths.
+        paths_func = filt.paths_func
+        prepend_dir_path = self.prepend_dir_path
+
         def get_and_prepend_path(lib: Library) -> Tuple[Library, List[str]]:
-            paths = filt.paths_func(lib)
-            full_paths = list(map(lambda path: self.prepend_dir_path(path, lib), paths))
-            return lib, full_paths
+            return lib, [prepend_dir_path(path, lib) for path in paths_func(lib)]
 
         libs_and_paths = list(map(get_and_prepend_path, filtered_libs))  # type: List[Tuple[Library, List[str]]]
 
         # Existence checks for paths.
+        existence_check_func = self.make_check_isfile(filt.description) if filt.is_file else self.make_check_isdir(
+            filt.description)
+
         def check_lib_and_paths(inp: Tuple[Library, List[str]]) -> Tuple[Library, List[str]]:
             lib = inp[0]  # type: Library
             paths = inp[1]  # type: List[str]
-            existence_check_func = self.make_check_isfile(filt.description) if filt.is_file else self.make_check_isdir(
-                filt.description)
             paths = list(map(existence_check_func, paths))
             return lib, paths
 
@@ -883,13 +888,13 @@ class HammerTechnology:
             return paths
         extraction_func = get_or_else(filt.extraction_func, identity_extraction_func)
 
-        output_list = reduce_list_str(add_lists, list(map(lambda t: extraction_func(t[0], t[1]), libs_and_paths)), [])  # type: List[str]
+        output_list = list(chain.from_iterable(extraction_func(lib, paths) for lib, paths in libs_and_paths))  # type: List[str]
 
-        # Quickly check that it is actually a List[str].
+        # Quickly check that it is actually a List[str]. The per-item check is skipped under python -O.
         if not isinstance(output_list, List):
             raise TypeError("output_list is not a List[str], but a " + str(type(output_list)))
-        for i in output_list:
-            if not isinstance(i, str):
+        if __debug__:
+            if not all(isinstance(i, str) for i in output_list):
                 raise TypeError("output_list is a List but not a List[str]")
 
         # Uniquify results.
@@ -897,21 +902,22 @@ class HammerTechnology:
         # This is here to get stuff working since some CAD tools dislike duplicated arguments (e.g. duplicated stdcell
         # lib, etc).
         if uniquify:
-            in_place_unique(output_list)
+            output_list = list(dict.fromkeys(output_list))
 
         # Apply any list-level functions.
-        after_post_filter = reduce_named(
-            sequence=filt.extra_post_filter_funcs,
-            initial=output_list,
-            function=lambda libs, func: func(list(libs)),
-        )
+        after_post_filter = output_list  # type: List[str]
+        for post_filter_func in filt.extra_post_filter_funcs:
+            # Only copy into a list if the previous function did not already return one.
+            if not isinstance(after_post_filter, list):
+                after_post_filter = list(after_post_filter)
+            after_post_filter = post_filter_func(after_post_filter)
 
         # Finally, apply any output functions.
         # e.g. turning foo.db into ["--timing", "foo.db"].
         after_output_functions = list(map(lambda item: output_func(item, filt), after_post_filter))
 
         # Concatenate lists of List[str] together.
-        return reduce_list_str(add_lists, after_output_functions, [])
+        return list(chain.from_iterable(after_output_functions))
 
     def read_libs(self, library_types: Iterable[LibraryFilter], output_func: Callable[[str, LibraryFilter], List[str]],
                   extra_pre_filters: Optional[List[Callable[[Library], bool]]] = None,
@@ -931,14 +937,15 @@ class HammerTechnology:
         if extra_pre_filters is not None:
             assert isinstance(extra_pre_filters, List)
             pre_filts += extra_pre_filters
-        
-        return reduce_list_str(
-            add_lists,
-            map(
-                lambda lib: self.process_library_filter(pre_filts=pre_filts, filt=lib, output_func=output_func, must_exist=must_exist),
-                library_types
-            )
-        )
+
+        # The pre-filters are shared by every library filter, so run them in a single pass over the libraries.
+        libraries = [lib for lib in self.get_available_libraries() if all(f(lib) for f in pre_filts)]  # type: List[Library]
+
+        return list(chain.from_iterable(
+            self.process_library_filter(pre_filts=[], filt=lib, output_func=output_func, must_exist=must_exist,
+                                        libraries=libraries)
+            for lib in library_types
+        ))
 
 
 
@@ -970,9 +977,11 @@ class HammerTechnology:
         return self.get_setting("vlsi.inputs.supplies.VDD") == lib.supplies.VDD and self.get_setting("vlsi.inputs.supplies.GND") == lib.supplies.GND
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def make_check_isdir(description: str = "Path") -> Callable[[str], str]:
         """
         Utility function to generate functions which check whether a path exists.
+        The generated functions are cached per description.
         """
         def check_isdir(path: str) -> str:
             if not os.path.isdir(path):
@@ -982,9 +991,11 @@ class HammerTechnology:
         return check_isdir
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def make_check_isfile(description: str = "File") -> Callable[[str], str]:
         """
         Utility function to generate functions which check whether a path exists.
+        The generated functions are cached per description.
         """
         def check_isfile(path: str) -> str:
             if not os.path.isfile(path):
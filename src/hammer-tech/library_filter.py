@@ -7,7 +7,7 @@
 #  See LICENSE for licence details.
 
 from numbers import Number
-from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 from hammer_utils import get_or_else, assert_function_type
 
@@ -78,9 +78,10 @@ class LibraryFilter(NamedTuple('LibraryFilter', [
     ('filter_func', Optional[Callable[["Library"], bool]]),
     # Sort function to control the order in which outputs are listed
     ('sort_func', Optional[Callable[["Library"], Union[Number, str, tuple]]]),
-    # List of functions to call on the list-level (the list of elements generated by func) before output and
+    # Functions to call on the list-level (the list of elements generated by func) before output and
     # post-processing.
-    ('extra_post_filter_funcs', List[Callable[[List[str]], List[str]]])
+    # Stored as a tuple so that filters are fully immutable and can be safely shared and cached.
+    ('extra_post_filter_funcs', Tuple[Callable[[List[str]], List[str]], ...])
 ])):
     """
     "Library" filter containing a filtering function, identifier tag, and a short
@@ -95,7 +96,7 @@ class LibraryFilter(NamedTuple('LibraryFilter', [
             extraction_func: Optional[ExtractionFunctionType] = None,
             filter_func: Optional[Callable[["Library"], bool]] = None,
             sort_func: Optional[Callable[["Library"], Union[Number, str, tuple]]] = None,
-            extra_post_filter_funcs: Optional[List[Callable[[List[str]], List[str]]]] = None) -> "LibraryFilter":
+            extra_post_filter_funcs: Optional[Iterable[Callable[[List[str]], List[str]]]] = None) -> "LibraryFilter":
         """Convenience "constructor" with some default arguments."""
 
         check_paths_func(paths_func)
@@ -110,5 +111,5 @@ class LibraryFilter(NamedTuple('LibraryFilter', [
             extraction_func,
             filter_func,
             sort_func,
-            list(get_or_else(extra_post_filter_funcs, []))
+            tuple(get_or_else(extra_post_filter_funcs, ()))
         )
@@ -26,11 +26,16 @@ def isinstance_check(t: str) -> str:
 def generate_from_list(template: str, lst) -> list:
     def format_var(var):
         attr_error_logic = """raise ValueError("Nothing set for the {var_desc} yet")"""
+        var_value = "value"
 
         if var.type.startswith("Iterable"):
             var_type_instance_check = isinstance_check("Iterable")
+            # Materialize iterables so that they can be read more than once.
+            var_value = "list(value)"
         elif var.type.startswith("List"):
             var_type_instance_check = isinstance_check("List")
+            # Copy lists so that later appends to the property do not modify the caller's list (e.g. a setting).
+            var_value = "list(value)"
         elif var.type.startswith("Optional"):
             m = re.search(r"Optional\[(\S+)\]", var.type)
             subtype = str(m.group(1))
@@ -42,7 +47,7 @@ def generate_from_list(template: str, lst) -> list:
         t = template.replace("[[attr_error_logic]]", attr_error_logic)
 
         return t.format(var_name=var.name, var_type=var.type, var_desc=var.desc,
-                        var_type_instance_check=var_type_instance_check)
+                        var_type_instance_check=var_type_instance_check, var_value=var_value)
 
     return list(map(format_var, lst))
 
@@ -74,7 +79,7 @@ def generate_interface(interface: Interface) -> None:
         \"""Set the {var_desc}.\"""
         if not ({var_type_instance_check}):
             raise TypeError("{var_name} must be a {var_type}")
-        self.attr_setter("_{var_name}", value)
+        self.attr_setter("_{var_name}", {var_value})
 """
     start_key = "    ### Generated interface %s ###" % (interface.module)
     end_key = "    ### END Generated interface %s ###" % (interface.module)
@@ -5,9 +5,11 @@
 #
 #  See LICENSE for licence details.
 
-from functools import reduce
+import atexit
+import time
+import weakref
 from enum import Enum
-from typing import Callable, Iterable, List, NamedTuple, Type
+from typing import Callable, Iterable, List, NamedTuple, Sequence, Tuple, Type
 
 class Level(Enum):
     """
@@ -30,7 +32,7 @@ class Level(Enum):
 FullMessage = NamedTuple('FullMessage', [
     ('message', str),
     ('level', Level),
-    ('context', List[str])
+    ('context', Sequence[str])
 ])
 
 
@@ -45,6 +47,12 @@ def with_default_callbacks(cls):
 class HammerVLSIFileLogger:
     """A file logger for HammerVLSILogging."""
 
+    __slots__ = ('_file', '_format_msg_callback', '_last_flush', '__weakref__')
+
+    # Maximum time (in seconds) between flushes of messages below WARNING, so that the log can be followed while a
+    # tool runs.
+    flush_interval = 1.0  # type: float
+
     def __init__(self, output_path: str, format_msg_callback: Callable[[FullMessage], str] = None) -> None:
         """
         Create a new file logger.
@@ -52,17 +60,30 @@ class HammerVLSIFileLogger:
         :param output_path: Output path of the logger.
         :param format_msg_callback: Optional callback to run to build the message. None to use HammerVLSILogging.build_log_message.
         """
-        self._file = open(output_path, "a")
+        self._file = open(output_path, "a", buffering=1 << 16)
         self._format_msg_callback = format_msg_callback
+        self._last_flush = time.monotonic()
+        # Make sure buffered messages make it to the file even if close() is never called.
+        _open_file_loggers.add(self)
 
     def __enter__(self):
         return self
 
+    def flush(self) -> None:
+        """
+        Write any buffered messages out to the file.
+        """
+        if self._file.closed:
+            return
+        self._file.flush()
+        self._last_flush = time.monotonic()
+
     def close(self) -> None:
         """
         Close this file logger.
         """
         self._file.close()
+        _open_file_loggers.discard(self)
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.close()
@@ -76,10 +97,25 @@ class HammerVLSIFileLogger:
                 self._file.write(self._format_msg_callback(fullmessage) + "\n")
             else:
                 self._file.write(HammerVLSILogging.build_log_message(fullmessage) + "\n")
+            # Warnings and errors are written out right away so that they are seen (and not lost if the process dies).
+            if fullmessage.level.value >= Level.WARNING.value or \
+                    time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
 
         return file_callback
 
 
+# File loggers which are still open, flushed at exit. Weak so that loggers which are dropped without being closed
+# can still be garbage collected (which closes their files).
+_open_file_loggers = weakref.WeakSet()  # type: weakref.WeakSet[HammerVLSIFileLogger]
+
+
+@atexit.register
+def _flush_open_file_loggers() -> None:
+    for file_logger in list(_open_file_loggers):
+        file_logger.flush()
+
+
 @with_default_callbacks
 class HammerVLSILogging:
     """Singleton which handles logging in hammer-vlsi.
@@ -97,6 +133,10 @@ class HammerVLSILogging:
     # Enable printing the tag (e.g. "[synthesis] ...).
     enable_tag = True  # type: bool
 
+    # Minimum level (as Level.value) of messages to dispatch to callbacks.
+    # Messages below this level are dropped before any callback runs.
+    min_level = Level.DEBUG.value  # type: int
+
     # Various escape characters for colour output.
     COLOUR_BLUE = "\033[96m"
     COLOUR_GREY = "\033[37m"
@@ -106,6 +146,9 @@ class HammerVLSILogging:
     # Restore the default terminal colour.
     COLOUR_CLEAR = "\033[0m"
 
+    # Colour table to translate level -> colour, indexed by Level.value.
+    _COLOUR_TABLE = (COLOUR_GREY, COLOUR_BLUE, COLOUR_YELLOW, COLOUR_RED, COLOUR_RED_BG)
+
     # Some default callback implementations.
     @classmethod
     def callback_print(cls, fullmessage: FullMessage) -> None:
@@ -124,10 +167,7 @@ class HammerVLSILogging:
     @classmethod
     def build_log_message(cls, fullmessage: FullMessage) -> str:
         """Build a plain message for logs, without colour."""
-        template = "{context} {level}: {message}"
-
-        return template.format(context=cls.get_tag(fullmessage.context), level=fullmessage.level,
-                               message=fullmessage.message)
+        return "%s %s: %s" % (cls.get_tag(fullmessage.context), fullmessage.level, fullmessage.message)
 
     # List of callbacks to call for logging.
     callbacks = []  # type: List[Callable[[FullMessage], None]]
@@ -142,6 +182,16 @@ class HammerVLSILogging:
         """Add a callback."""
         cls.callbacks.append(callback)
 
+    @classmethod
+    def set_min_level(cls, level: Level) -> None:
+        """Set the minimum level of messages to log."""
+        cls.min_level = level.value
+
+    @classmethod
+    def is_enabled_for(cls, level: Level) -> bool:
+        """Check if messages of the given level will be dispatched to callbacks."""
+        return level.value >= cls.min_level
+
     @classmethod
     def context(cls, new_context: str = "") -> "HammerVLSILoggingContext":
         """
@@ -150,23 +200,16 @@ class HammerVLSILogging:
         :param new_context: Context name. Leave blank to get the global context.
         """
         if new_context == "":
-            return HammerVLSILoggingContext([], cls)
+            return HammerVLSILoggingContext((), cls)
         else:
-            return HammerVLSILoggingContext([new_context], cls)
+            return HammerVLSILoggingContext((new_context,), cls)
 
     @classmethod
     def get_colour_escape(cls, level: Level) -> str:
         """Colour table to translate level -> colour in logging."""
-        table = {
-            Level.DEBUG: cls.COLOUR_GREY,
-            Level.INFO: cls.COLOUR_BLUE,
-            Level.WARNING: cls.COLOUR_YELLOW,
-            Level.ERROR: cls.COLOUR_RED,
-            Level.FATAL: cls.COLOUR_RED_BG
-        }
-        if level in table:
-            return table[level]
-        else:
+        try:
+            return cls._COLOUR_TABLE[level.value]
+        except IndexError:
             return ""
 
     @classmethod
@@ -174,32 +217,31 @@ class HammerVLSILogging:
         """
         Log the given message at the given level in the given context.
         """
+        if fullmessage.level.value < cls.min_level:
+            return
         for callback in cls.callbacks:
             callback(fullmessage)
 
     @classmethod
     def build_message(cls, fullmessage: FullMessage) -> str:
         """Build a colour message."""
-        message = fullmessage.message
-        level = fullmessage.level
-        context = fullmessage.context
-
-        context_tag = cls.get_tag(context)  # type: str
+        message = fullmessage.message  # type: str
 
-        output = ""  # type: str
-        output += cls.get_colour_escape(level) if cls.enable_colour else ""
-        if cls.enable_tag and context_tag != "":
-            output += context_tag + " "
-        output += message
-        output += cls.COLOUR_CLEAR if cls.enable_colour else ""
+        # Only build the parts that are enabled.
+        if cls.enable_tag:
+            context_tag = cls.get_tag(fullmessage.context)  # type: str
+            if context_tag != "":
+                message = context_tag + " " + message
 
-        return output
+        if cls.enable_colour:
+            return cls.get_colour_escape(fullmessage.level) + message + cls.COLOUR_CLEAR
+        return message
 
     @staticmethod
-    def get_tag(context: List[str]) -> str:
+    def get_tag(context: Sequence[str]) -> str:
         """Helper function to get the tag for outputting a message given a context."""
-        if len(context) > 0:
-            return str(reduce(lambda a, b: a + " " + b, map(lambda x: "[%s]" % (x), context)))
+        if context:
+            return "[" + "] [".join(context) + "]"
         else:
             return "[<global>]"
 
@@ -219,20 +261,23 @@ class HammerVLSILoggingContext:
     e.g. ["synthesis", "subprocess run-synthesis"]
     """
 
-    def __init__(self, context: List[str], logging_class: Type[HammerVLSILogging]) -> None:
+    __slots__ = ('_context', 'logging_class', '_log')
+
+    def __init__(self, context: Sequence[str], logging_class: Type[HammerVLSILogging]) -> None:
         """
         Create a new interface with the given context.
         """
-        self._context = context  # type: List[str]
+        # Contexts are immutable so that subcontexts can share them without copying.
+        self._context = tuple(context)  # type: Tuple[str, ...]
         self.logging_class = logging_class  # type: Type[HammerVLSILogging]
+        # Bind the dispatch method once so that each log call is a single call.
+        self._log = logging_class.log  # type: Callable[[FullMessage], None]
 
     def context(self, new_context: str) -> "HammerVLSILoggingContext":
         """
         Create a new subcontext from this context.
         """
-        context2 = list(self._context)
-        context2.append(new_context)
-        return HammerVLSILoggingContext(context2, self.logging_class)
+        return HammerVLSILoggingContext(self._context + (new_context,), self.logging_class)
 
     def debug(self, message: str) -> None:
         """Create an debug-level log message."""
@@ -254,5 +299,12 @@ class HammerVLSILoggingContext:
         """Create an fatal-level log message."""
         return self.log(message, Level.FATAL)
 
+    def is_enabled_for(self, level: Level) -> bool:
+        """Check if messages of the given level will be logged."""
+        return self.logging_class.is_enabled_for(level)
+
     def log(self, message: str, level: Level) -> None:
-        return self.logging_class.log(FullMessage(message, level, self._context))
+        # Skip building the message entirely if it would be dropped anyway.
+        if not self.is_enabled_for(level):
+            return None
+        return self._log(FullMessage(message, level, self._context))
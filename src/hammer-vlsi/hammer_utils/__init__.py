@@ -11,8 +11,9 @@ import math
 import sys
 import os
 import errno
+from collections import deque
 from functools import reduce
-from typing import List, Any, Set, Dict, Tuple, TypeVar, Callable, Iterable, Optional, Union
+from typing import List, Any, Set, Deque, Dict, Tuple, TypeVar, Callable, Iterable, Optional, Union
 from enum import Enum, unique
 import decimal
 from decimal import Decimal
@@ -161,32 +162,29 @@ def topological_sort(graph: Dict[str, Tuple[List[str], List[str]]], starting_nod
     :return: A valid topological ordering of the graph.
     """
 
-    # Make a copy of the graph since we'll be modifying it.
-    working_graph = deepdict(graph)  # type: Dict[str, Tuple[List[str], List[str]]]
+    # Track the number of remaining incoming edges per node instead of modifying a copy of the graph.
+    indegree = {node: len(edges[1]) for node, edges in graph.items()}  # type: Dict[str, int]
 
-    queue = []  # type: List[str]
+    queue = deque(starting_nodes)  # type: Deque[str]
     output = []  # type: List[str]
 
-    # Add starting nodes to the queue.
-    queue.extend(starting_nodes)
-
     while len(queue) > 0:
         # Get front-most node in the queue.
-        node = queue.pop(0)
+        node = queue.popleft()
 
         # It should have no incoming edges.
-        assert len(working_graph[node][1]) == 0
+        assert indegree[node] == 0
 
         # Add it to the output.
         output.append(node)
 
         # Examine all targets of outgoing edges of this node.
-        for target_node in working_graph[node][0]:
+        for target_node in graph[node][0]:
             # Remove the corresponding incoming edge there.
-            working_graph[target_node][1].remove(node)
+            indegree[target_node] -= 1
 
             # If the target node now has no incoming nodes, we can add it to the queue.
-            if len(working_graph[target_node][1]) == 0:
+            if indegree[target_node] == 0:
                 queue.append(target_node)
 
     return output
@@ -7,10 +7,11 @@
 #  See LICENSE for licence details.
 
 from functools import reduce, partial
+from itertools import chain
 from typing import NamedTuple, List, Optional, Tuple, Dict, Set, Any
 
-import datetime
 import os
+import time
 
 from hammer_utils import *
 
@@ -39,6 +40,9 @@ HammerDriverOptions = NamedTuple('HammerDriverOptions', [
     ('obj_dir', str)
 ])
 
+# Default log file name, formatted with the current time.
+_DEFAULT_LOG_FILE_FORMAT = "hammer-vlsi-%Y%m%d-%H%M%S.log"
+
 
 class HammerDriver:
     @staticmethod
@@ -47,7 +51,7 @@ class HammerDriver:
         return HammerDriverOptions(
             environment_configs=[],
             project_configs=[],
-            log_file=datetime.datetime.now().strftime("hammer-vlsi-%Y%m%d-%H%M%S.log"),
+            log_file=time.strftime(_DEFAULT_LOG_FILE_FORMAT),
             obj_dir=os.path.realpath(HammerVLSISettings.hammer_vlsi_path)
         )
 
@@ -144,13 +148,14 @@ class HammerDriver:
         tech_paths = list(self.database.get_setting("vlsi.core.technology_path"))  # type: List[str]
 
         self.log.info("Loading technology '{0}'".format(tech_str))
-        tech_opt = None  # type: Optional[hammer_tech.HammerTechnology]
-        for base_path in tech_paths:
+
+        def try_load(base_path: str) -> Optional[hammer_tech.HammerTechnology]:
             sys.path.append(base_path)
-            path = os.path.join(base_path, tech_str)
-            tech_opt = hammer_tech.HammerTechnology.load_from_dir(tech_str, path)
-            if tech_opt is not None:
-                break
+            return hammer_tech.HammerTechnology.load_from_dir(tech_str, os.path.join(base_path, tech_str))
+
+        # Stop at the first technology path which has the technology; later paths are never touched.
+        tech_opt = next((t for t in map(try_load, tech_paths) if t is not None),
+                        None)  # type: Optional[hammer_tech.HammerTechnology]
         if tech_opt is None:
             self.log.fatal("Technology {0} not found or missing .tech.[json/yml]!".format(tech_str))
             return
@@ -169,7 +174,7 @@ class HammerDriver:
         """
         Calls self.database.update_tools with self.tool_configs as a list.
         """
-        tools = reduce(lambda a, b: a + b, list(self.tool_configs.values()))
+        tools = list(chain.from_iterable(self.tool_configs.values()))
         self.database.update_tools(tools)
 
     def instantiate_tool_from_config(self, tool_type: str,
@@ -903,7 +908,7 @@ class HammerDriver:
                  or None if output_dict was invalid
         """
         try:
-            output_files = deeplist(output_dict["synthesis.outputs.output_files"])
+            output_files = list(output_dict["synthesis.outputs.output_files"])
             result = {
                 "par.inputs.input_files": output_files,
                 "par.inputs.top_module": output_dict["synthesis.inputs.top_module"],
@@ -927,7 +932,7 @@ class HammerDriver:
                  or None if output_dict was invalid
         """
         try:
-            output_files = deeplist(output_dict["synthesis.outputs.output_files"])
+            output_files = list(output_dict["synthesis.outputs.output_files"])
             result = {
                 "sim.inputs.input_files": output_files,
                 "sim.inputs.input_files_meta": "append",
@@ -954,7 +959,7 @@ class HammerDriver:
                  or None if output_dict was invalid
         """
         try:
-            output_files = deeplist(output_dict["synthesis.outputs.output_files"])
+            output_files = list(output_dict["synthesis.outputs.output_files"])
             result = {
                 "power.inputs.input_files": output_files,
                 "power.inputs.input_files_meta": "append",
@@ -979,8 +984,8 @@ class HammerDriver:
                  or None if output_dict was invalid
         """
         try:
-            reference_files = deeplist(output_dict["synthesis.inputs.input_files"])
-            input_files = deeplist(output_dict["synthesis.outputs.output_files"])
+            reference_files = list(output_dict["synthesis.inputs.input_files"])
+            input_files = list(output_dict["synthesis.outputs.output_files"])
             result = {
                 "formal.inputs.input_files": input_files,
                 "formal.inputs.input_files_meta": "append",
@@ -1005,7 +1010,7 @@ class HammerDriver:
                  or None if output_dict was invalid
         """
         try:
-            input_files = deeplist(output_dict["synthesis.outputs.output_files"])
+            input_files = list(output_dict["synthesis.outputs.output_files"])
             result = {
                 "timing.inputs.input_files": input_files,
                 "timing.inputs.input_files_meta": "append",
@@ -1030,7 +1035,7 @@ class HammerDriver:
                  or None if output_dict was invalid
         """
         try:
-            sim_input_files = deeplist([output_dict["par.outputs.output_sim_netlist"]])
+            sim_input_files = [output_dict["par.outputs.output_sim_netlist"]]
             result = {
                 "sim.inputs.input_files": sim_input_files,
                 "sim.inputs.input_files_meta": "append",
@@ -1079,8 +1084,8 @@ class HammerDriver:
                  or None if output_dict was invalid
         """
         try:
-            reference_files = deeplist(output_dict["par.inputs.input_files"])
-            input_files = deeplist([output_dict["par.outputs.output_sim_netlist"]])
+            reference_files = list(output_dict["par.inputs.input_files"])
+            input_files = [output_dict["par.outputs.output_sim_netlist"]]
             result = {
                 "formal.inputs.input_files": input_files,
                 "formal.inputs.input_files_meta": "append",
@@ -1105,7 +1110,7 @@ class HammerDriver:
                  or None if output_dict was invalid
         """
         try:
-            input_files = deeplist([output_dict["par.outputs.output_netlist"]])
+            input_files = [output_dict["par.outputs.output_netlist"]]
             result = {
                 "timing.inputs.input_files": input_files,
                 "timing.inputs.input_files_meta": "append",
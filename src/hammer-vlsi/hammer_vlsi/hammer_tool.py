@@ -11,8 +11,8 @@ import os
 import re
 import shlex
 from abc import ABCMeta, abstractmethod
-from functools import reduce
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, cast
+from functools import lru_cache, reduce
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Set, Tuple, cast
 from inspect import cleandoc
 
 import hammer_config
@@ -43,6 +43,23 @@ def check_hammer_step_function(func: HammerStepFunction) -> None:
     assert_function_type(func, args=[HammerTool], return_type=bool)
 
 
+@lru_cache(maxsize=128)
+def _tcl_set_regex(variable: str) -> Pattern[str]:
+    """Get the compiled regex matching a "set VARIABLE ..." line in a TCL script."""
+    return re.compile(r'^set +%s.*' % (re.escape(variable)), flags=re.MULTILINE)
+
+
+@lru_cache(maxsize=128)
+def _time_value(value: str) -> TimeValue:
+    """Parse a time value string; TimeValues are immutable, so parsed values are shared."""
+    return TimeValue(value)
+
+
+# Escapes a command so that it can be echoed inside a double-quoted TCL string, without any variable or command
+# substitution.
+_TCL_PUTS_ESCAPE = str.maketrans({'"': '\\"', '\\': '\\\\', '$': '\\$', '[': '\\['})
+
+
 class HammerTool(metaclass=ABCMeta):
     # Interface methods.
     @property
@@ -291,6 +308,8 @@ class HammerTool(metaclass=ABCMeta):
         if not os.path.isabs(path):
             path = os.path.abspath(path)
         self._rundir = path  # type: str
+        # Precompute the database dump path since it is needed for every subprocess.
+        self._database_dump_path = os.path.join(path, "config_db_tmp.json")  # type: str
 
     @property
     def input_files(self) -> Iterable[str]:
@@ -309,9 +328,12 @@ class HammerTool(metaclass=ABCMeta):
         Set the input files for this tool library.
         The exact nature of the files will depend on the type of library.
         """
-        if not isinstance(value, Iterable):
+        try:
+            iter(value)
+        except TypeError:
             raise TypeError("input_files must be a Iterable[str]")
-        self._input_files = value # type: Iterable[str]
+        # Materialize the files once so that one-shot iterables (e.g. generators) can be read more than once.
+        self._input_files = list(value) # type: Iterable[str]
 
 
     @property
@@ -881,14 +903,25 @@ class HammerTool(metaclass=ABCMeta):
     def set_database(self, database: hammer_config.HammerDatabase) -> None:
         """Set the settings database for use by the tool."""
         self._database = database # type: hammer_config.HammerDatabase
+        self._dumped_database = None # type: Optional[Tuple[str, str]]
+
+    # (path, contents) of the last database dump, used to skip rewriting an unchanged dump.
+    _dumped_database = None # type: Optional[Tuple[str, str]]
 
     def dump_database(self) -> str:
         """Dump the current database JSON in a temporary file in the run_dir and return the path.
+        The file is only rewritten if the database has changed since the last dump.
         """
-        path = os.path.join(self.run_dir, "config_db_tmp.json")
+        try:
+            path = self._database_dump_path
+        except AttributeError:
+            raise ValueError("Internal error: run dir location not set by hammer-vlsi")
         db_contents = self._database.get_database_json()
-        with open(path, 'w') as f:
-            f.write(db_contents)
+        if self._dumped_database != (path, db_contents) or not os.path.isfile(path):
+            # The dump may contain non-ASCII characters.
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(db_contents)
+            self._dumped_database = (path, db_contents)
         return path
 
     @property
@@ -947,7 +980,7 @@ class HammerTool(metaclass=ABCMeta):
 
         if enter_script_location == "":
             enter_script_location = os.path.join(self.run_dir, "enter")
-        enter_script = "\n".join(map(lambda k_v: "export {0}={1}".format(k_v[0], escape_value(k_v[1])), sorted(self.env_vars.items())))
+        enter_script = "\n".join(["export %s=%s" % (k, escape_value(v)) for k, v in sorted(self.env_vars.items())])
         with open(enter_script_location, "w") as f:
             f.write(enter_script)
 
@@ -958,9 +991,10 @@ class HammerTool(metaclass=ABCMeta):
         :return: True if all files exist and have the specified extensions.
         """
         verilog_args = self.input_files
+        extensions_tuple = tuple(extensions)
         error = False
         for v in verilog_args:
-            if not v.endswith(tuple(extensions)):
+            if not v.endswith(extensions_tuple):
                 self.logger.error("Input of unsupported type {0} detected!".format(v))
                 error = True
             if not os.path.isfile(v):
@@ -1007,12 +1041,10 @@ class HammerTool(metaclass=ABCMeta):
             value_string = '"' + value_string + '"'
         replacement_string = "set %s %s;" % (variable, value_string)
 
-        regex = r'^set +%s.*' % (re.escape(variable))
-        if re.search(regex, tcl_contents, flags=re.MULTILINE) is None:
+        new_tcl_contents, count = _tcl_set_regex(variable).subn(replacement_string, tcl_contents)
+        if count == 0:
             raise ValueError("set %s line not found in tcl file %s!" % (variable, tcl_path))
 
-        new_tcl_contents = re.sub(regex, replacement_string, tcl_contents, flags=re.MULTILINE) # type: str
-
         with open(tcl_path, "w") as f:
             f.write(new_tcl_contents)
 
@@ -1049,26 +1081,22 @@ class HammerTool(metaclass=ABCMeta):
         clocks = self.get_setting("vlsi.inputs.clocks")
         output = [] # type: List[ClockPort]
         for clock_port in clocks:
-            clock = ClockPort(
-                name=clock_port["name"], period=TimeValue(clock_port["period"]),
-                uncertainty=None, path=None, generated=None, source_path=None, divisor=None, group=None
-            )
-            if "path" in clock_port:
-                clock = clock._replace(path=clock_port["path"])
-            if "uncertainty" in clock_port:
-                clock = clock._replace(uncertainty=TimeValue(clock_port["uncertainty"]))
-            if "group" in clock_port:
-                clock = clock._replace(group=clock_port["group"])
             generated = None  # type: Optional[bool]
+            source_path = None  # type: Optional[str]
+            divisor = None  # type: Optional[int]
             if "generated" in clock_port:
                 generated = bool(clock_port["generated"])
                 if generated:
-                    clock = clock._replace(
-                        source_path=clock_port["source_path"],
-                        divisor=int(clock_port["divisor"])
-                    )
-            clock = clock._replace(generated=generated)
-            output.append(clock)
+                    source_path = clock_port["source_path"]
+                    divisor = int(clock_port["divisor"])
+            # Build each ClockPort in one go rather than through a chain of _replace copies.
+            output.append(ClockPort(
+                name=clock_port["name"], period=_time_value(clock_port["period"]),
+                path=clock_port.get("path"),
+                uncertainty=_time_value(clock_port["uncertainty"]) if "uncertainty" in clock_port else None,
+                generated=generated, source_path=source_path, divisor=divisor,
+                group=clock_port.get("group")
+            ))
         return output
 
     def get_time_unit(self) -> TimeValue:
@@ -1564,14 +1592,13 @@ class HammerTool(metaclass=ABCMeta):
         :param target_path: Where to append the content.
         """
         if content_to_append != "":
-            content_lines = content_to_append.split("\n")  # type: List[str]
-
             # TODO(edwardw): come up with a more generic "source locator" for hammer
             header_text = "# The following snippet was added by HAMMER"
-            content_lines.insert(0, header_text)
 
+            # Write the content as-is rather than splitting and re-joining it under the header.
             with open(target_path, "a") as f:
-                f.write("\n".join(content_lines))
+                f.write(header_text + "\n")
+                f.write(content_to_append)
 
     @staticmethod
     def tcl_append(cmd: str, output_buffer: List[str], clean: bool = False) -> None:
@@ -1595,5 +1622,5 @@ class HammerTool(metaclass=ABCMeta):
         :param clean: True if you want to trim the leading indendation from the string, False otherwise. See inspect.cleandoc() for what this does.
         """
         cleaned = cleandoc(cmd) if clean else cmd
-        output_buffer.append("""puts "{0}" """.format(cleaned.replace('"', '\"')))
+        output_buffer.append('puts "' + cleaned.translate(_TCL_PUTS_ESCAPE) + '" ')
         output_buffer.append(cleaned)
@@ -189,7 +189,7 @@ class HammerSRAMGeneratorTool(HammerTool):
         """Set the input sram parameters to be generated."""
         if not (isinstance(value, List)):
             raise TypeError("input_parameters must be a List[SRAMParameters]")
-        self.attr_setter("_input_parameters", value)
+        self.attr_setter("_input_parameters", list(value))
 
 
     ### Outputs ###
@@ -211,7 +211,7 @@ class HammerSRAMGeneratorTool(HammerTool):
         """Set the list of the hammer tech libraries corresponding to generated srams."""
         if not (isinstance(value, List)):
             raise TypeError("output_libraries must be a List[ExtraLibrary]")
-        self.attr_setter("_output_libraries", value)
+        self.attr_setter("_output_libraries", list(value))
 
     ### END Generated interface HammerSRAMGeneratorTool ###
 
@@ -226,7 +226,7 @@ class HammerSRAMGeneratorTool(HammerTool):
         return True #we fill in output_libraries in generate_all_srams_and_corners
 
     def export_config_outputs(self) -> Dict[str, Any]:
-        outputs = deepdict(super().export_config_outputs())
+        outputs = dict(super().export_config_outputs())
         simple_ex = []
         for ex in self.output_libraries: # type: ExtraLibrary
             simple_lib = json.loads(ex.library.serialize())
@@ -265,7 +265,7 @@ class HammerSynthesisTool(HammerTool):
         pass
 
     def export_config_outputs(self) -> Dict[str, Any]:
-        outputs = deepdict(super().export_config_outputs())
+        outputs = dict(super().export_config_outputs())
         outputs["synthesis.outputs.output_files"] = self.output_files
         outputs["synthesis.inputs.input_files"] = self.input_files
         outputs["synthesis.inputs.top_module"] = self.top_module
@@ -292,7 +292,7 @@ class HammerSynthesisTool(HammerTool):
         """Set the input collection of source RTL files (e.g. *.v)."""
         if not (isinstance(value, List)):
             raise TypeError("input_files must be a List[str]")
-        self.attr_setter("_input_files", value)
+        self.attr_setter("_input_files", list(value))
 
 
     ### Outputs ###
@@ -314,7 +314,7 @@ class HammerSynthesisTool(HammerTool):
         """Set the output collection of mapped (post-synthesis) RTL files."""
         if not (isinstance(value, List)):
             raise TypeError("output_files must be a List[str]")
-        self.attr_setter("_output_files", value)
+        self.attr_setter("_output_files", list(value))
 
 
     @property
@@ -405,7 +405,7 @@ class HammerPlaceAndRouteTool(HammerTool):
         pass
 
     def export_config_outputs(self) -> Dict[str, Any]:
-        outputs = deepdict(super().export_config_outputs())
+        outputs = dict(super().export_config_outputs())
         outputs["par.outputs.output_ilms"] = list(map(lambda s: s.to_setting(), self.output_ilms))
         outputs["par.outputs.output_ilms_meta"] = "append"
         outputs["par.outputs.output_gds"] = str(self.output_gds)
@@ -439,7 +439,7 @@ class HammerPlaceAndRouteTool(HammerTool):
         """Set the input post-synthesis netlist files."""
         if not (isinstance(value, List)):
             raise TypeError("input_files must be a List[str]")
-        self.attr_setter("_input_files", value)
+        self.attr_setter("_input_files", list(value))
 
 
     @property
@@ -481,7 +481,7 @@ class HammerPlaceAndRouteTool(HammerTool):
         """Set the (optional) output ILM information for hierarchical mode."""
         if not (isinstance(value, List)):
             raise TypeError("output_ilms must be a List[ILMStruct]")
-        self.attr_setter("_output_ilms", value)
+        self.attr_setter("_output_ilms", list(value))
 
 
     @property
@@ -561,7 +561,7 @@ class HammerPlaceAndRouteTool(HammerTool):
         """Set the list of cells to explicitly map hierarchically in LVS."""
         if not (isinstance(value, List)):
             raise TypeError("hcells_list must be a List[str]")
-        self.attr_setter("_hcells_list", value)
+        self.attr_setter("_hcells_list", list(value))
 
 
     @property
@@ -889,7 +889,7 @@ class HammerSignoffTool(HammerTool):
 class HammerDRCTool(HammerSignoffTool):
 
     def export_config_outputs(self) -> Dict[str, Any]:
-        outputs = deepdict(super().export_config_outputs())
+        outputs = dict(super().export_config_outputs())
         outputs["drc.inputs.top_module"] = self.top_module
         return outputs
 
@@ -996,7 +996,7 @@ class HammerDRCTool(HammerSignoffTool):
 class HammerLVSTool(HammerSignoffTool):
 
     def export_config_outputs(self) -> Dict[str, Any]:
-        outputs = deepdict(super().export_config_outputs())
+        outputs = dict(super().export_config_outputs())
         outputs["lvs.inputs.top_module"] = self.top_module
         return outputs
 
@@ -1108,7 +1108,7 @@ class HammerLVSTool(HammerSignoffTool):
         """Set the path to the input SPICE or Verilog schematic files (e.g. *.v or *.spi)."""
         if not (isinstance(value, List)):
             raise TypeError("schematic_files must be a List[str]")
-        self.attr_setter("_schematic_files", value)
+        self.attr_setter("_schematic_files", list(value))
 
 
     @property
@@ -1128,7 +1128,7 @@ class HammerLVSTool(HammerSignoffTool):
         """Set the list of cells to explicitly map hierarchically in LVS."""
         if not (isinstance(value, List)):
             raise TypeError("hcells_list must be a List[str]")
-        self.attr_setter("_hcells_list", value)
+        self.attr_setter("_hcells_list", list(value))
 
 
     @property
@@ -1148,7 +1148,7 @@ class HammerLVSTool(HammerSignoffTool):
         """Set the list of (optional) input ILM information for hierarchical mode."""
         if not (isinstance(value, List)):
             raise TypeError("ilms must be a List[ILMStruct]")
-        self.attr_setter("_ilms", value)
+        self.attr_setter("_ilms", list(value))
 
 
     ### Outputs ###
@@ -1158,7 +1158,7 @@ class HammerLVSTool(HammerSignoffTool):
 class HammerSimTool(HammerTool):
 
     def export_config_outputs(self) -> Dict[str, Any]:
-        outputs = deepdict(super().export_config_outputs())
+        outputs = dict(super().export_config_outputs())
         outputs["sim.outputs.waveforms"] = self.output_waveforms
         outputs["sim.outputs.saifs"] = self.output_saifs
         outputs["sim.outputs.output_top_module"] = self.output_top_module
@@ -1220,7 +1220,7 @@ class HammerSimTool(HammerTool):
         """Set the paths to input verilog files."""
         if not (isinstance(value, List)):
             raise TypeError("input_files must be a List[str]")
-        self.attr_setter("_input_files", value)
+        self.attr_setter("_input_files", list(value))
 
 
     @property
@@ -1302,7 +1302,7 @@ class HammerSimTool(HammerTool):
         """Set the paths to output waveforms."""
         if not (isinstance(value, List)):
             raise TypeError("output_waveforms must be a List[str]")
-        self.attr_setter("_output_waveforms", value)
+        self.attr_setter("_output_waveforms", list(value))
 
 
     @property
@@ -1322,7 +1322,7 @@ class HammerSimTool(HammerTool):
         """Set the paths to output activity files."""
         if not (isinstance(value, List)):
             raise TypeError("output_saifs must be a List[str]")
-        self.attr_setter("_output_saifs", value)
+        self.attr_setter("_output_saifs", list(value))
 
 
     @property
@@ -1487,7 +1487,7 @@ class HammerPowerTool(HammerTool):
         """Set the paths to RTL input files or design netlist."""
         if not (isinstance(value, List)):
             raise TypeError("input_files must be a List[str]")
-        self.attr_setter("_input_files", value)
+        self.attr_setter("_input_files", list(value))
 
 
     @property
@@ -1507,7 +1507,7 @@ class HammerPowerTool(HammerTool):
         """Set the list of spef files for power anlaysis."""
         if not (isinstance(value, List)):
             raise TypeError("spefs must be a List[str]")
-        self.attr_setter("_spefs", value)
+        self.attr_setter("_spefs", list(value))
 
 
     @property
@@ -1547,7 +1547,7 @@ class HammerPowerTool(HammerTool):
         """Set the list of waveform dump files for dynamic power analysis."""
         if not (isinstance(value, List)):
             raise TypeError("waveforms must be a List[str]")
-        self.attr_setter("_waveforms", value)
+        self.attr_setter("_waveforms", list(value))
 
 
     @property
@@ -1567,7 +1567,7 @@ class HammerPowerTool(HammerTool):
         """Set the list of activity files for dynamic power analysis."""
         if not (isinstance(value, List)):
             raise TypeError("saifs must be a List[str]")
-        self.attr_setter("_saifs", value)
+        self.attr_setter("_saifs", list(value))
 
 
     @property
@@ -1676,7 +1676,7 @@ class HammerFormalTool(HammerTool):
         """Set the input collection of implementation design files."""
         if not (isinstance(value, List)):
             raise TypeError("input_files must be a List[str]")
-        self.attr_setter("_input_files", value)
+        self.attr_setter("_input_files", list(value))
 
 
     @property
@@ -1696,7 +1696,7 @@ class HammerFormalTool(HammerTool):
         """Set the input collection of reference design files."""
         if not (isinstance(value, List)):
             raise TypeError("reference_files must be a List[str]")
-        self.attr_setter("_reference_files", value)
+        self.attr_setter("_reference_files", list(value))
 
 
     @property
@@ -1771,7 +1771,7 @@ class HammerTimingTool(HammerTool):
         """Set the input collection of design files."""
         if not (isinstance(value, List)):
             raise TypeError("input_files must be a List[str]")
-        self.attr_setter("_input_files", value)
+        self.attr_setter("_input_files", list(value))
 
 
     @property
@@ -1922,25 +1922,24 @@ class HasSDCSupport(HammerTool):
         ungrouped_clocks = [] # type: List[str]
 
         clocks = self.get_clock_ports()
-        time_unit = self.get_time_unit().value_prefix + self.get_time_unit().unit
+        tech_time_unit = self.get_time_unit()
+        time_unit = tech_time_unit.value_prefix + tech_time_unit.unit
         for clock in clocks:
             # TODO: FIXME This assumes that library units are always in ns!!!
+            name = clock.name
             if get_or_else(clock.generated, False):
-                output.append("create_generated_clock -name {n} -source {m_path} -divide_by {div} {path}".
-                        format(n=clock.name, m_path=clock.source_path, div=clock.divisor, path=clock.path))
-            elif clock.path is not None:
-                output.append("create_clock {0} -name {1} -period {2}".format(clock.path, clock.name, clock.period.value_in_units(time_unit)))
+                output.append(f"create_generated_clock -name {name} -source {clock.source_path} -divide_by {clock.divisor} {clock.path}")
             else:
-                output.append("create_clock {0} -name {0} -period {1}".format(clock.name, clock.period.value_in_units(time_unit)))
+                period = clock.period.value_in_units(time_unit)
+                target = name if clock.path is None else clock.path
+                output.append(f"create_clock {target} -name {name} -period {period}")
             if clock.uncertainty is not None:
-                output.append("set_clock_uncertainty {1} [get_clocks {0}]".format(clock.name, clock.uncertainty.value_in_units(time_unit)))
+                uncertainty = clock.uncertainty.value_in_units(time_unit)
+                output.append(f"set_clock_uncertainty {uncertainty} [get_clocks {name}]")
             if clock.group is not None:
-                if clock.group in groups:
-                    groups[clock.group].append(clock.name)
-                else:
-                    groups[clock.group] = [clock.name]
+                groups.setdefault(clock.group, []).append(name)
             else:
-                ungrouped_clocks.append(clock.name)
+                ungrouped_clocks.append(name)
         if len(clocks):
             output.append("set_clock_groups -asynchronous {grouped} {ungrouped}".format(
                     grouped = " ".join(["-group {{ {c} }}".format(c=" ".join(clks)) for clks in groups.values()]),
@@ -2141,9 +2140,9 @@ def load_tool(tool_name: str, path: Iterable[str]) -> HammerTool:
     :param path: List of paths to get
     :return: HammerTool of the given tool
     """
-    # Temporarily add to the import path.
-    for p in path:
-        sys.path.insert(0, p)
+    path = tuple(path)
+    # Temporarily add to the import path, in the same order as inserting each path at the front.
+    sys.path[:0] = path[::-1]
     try:
         # import_module loads/caches modules into sys.modules, so if
         # another module with the same name (but different sys.path) is loaded,
@@ -2156,9 +2155,9 @@ def load_tool(tool_name: str, path: Iterable[str]) -> HammerTool:
         mod = importlib.import_module(tool_name)
     except ImportError:
         raise ValueError("No such tool " + tool_name)
-    # Now restore the original import path.
-    for _ in path:
-        sys.path.pop(0)
+    finally:
+        # Now restore the original import path.
+        del sys.path[:len(path)]
     try:
         tool_class = getattr(mod, "tool")
     except AttributeError:
@@ -2212,7 +2211,7 @@ class HammerPCBDeliverableTool(HammerTool):
         """Set the list of the PCB footprint files for the project."""
         if not (isinstance(value, List)):
             raise TypeError("output_footprints must be a List[str]")
-        self.attr_setter("_output_footprints", value)
+        self.attr_setter("_output_footprints", list(value))
 
 
     @property
@@ -2232,6 +2231,6 @@ class HammerPCBDeliverableTool(HammerTool):
         """Set the list of the PCB schematic symbol files for the project."""
         if not (isinstance(value, List)):
             raise TypeError("output_schematic_symbols must be a List[str]")
-        self.attr_setter("_output_schematic_symbols", value)
+        self.attr_setter("_output_schematic_symbols", list(value))
 
     ### END Generated interface HammerPCBDeliverableTool ###
@@ -12,13 +12,13 @@ import atexit
 import subprocess
 import termios
 import sys
-import datetime
+import time
 from abc import abstractmethod
 from functools import reduce
 from typing import Any, Dict, List, Tuple, NamedTuple, Optional
 
 from hammer_config import HammerDatabase
-from hammer_logging import HammerVLSILoggingContext
+from hammer_logging import HammerVLSILoggingContext, Level
 from hammer_utils import add_dicts, get_or_else
 
 __all__ = ['HammerSubmitCommand', 'HammerLocalSubmitCommand',
@@ -117,6 +117,26 @@ class HammerSubmitCommand:
 
         return prog_name + " " + prog_args
 
+    @staticmethod
+    def capture_output(proc: subprocess.Popen, logger: HammerVLSILoggingContext) -> str:
+        """
+        Log the output of a running subprocess line by line and also capture it.
+        :param proc: Subprocess with stdout piped
+        :param logger: Logging context for the subprocess output
+        :return: The entire output of the subprocess
+        """
+        so = proc.stdout
+        assert so is not None
+        # Check the level once since this loop runs for every output line.
+        log_output = logger.is_enabled_for(Level.DEBUG)  # type: bool
+        lines = []  # type: List[str]
+        for raw_line in iter(so.readline, b''):
+            line = raw_line.decode("utf-8")
+            if log_output:
+                logger.debug(line.rstrip())
+            lines.append(line)
+        return "".join(lines)
+
 
 class HammerLocalSubmitCommand(HammerSubmitCommand):
 
@@ -130,7 +150,7 @@ class HammerLocalSubmitCommand(HammerSubmitCommand):
         logger.debug("Executing subprocess: " + ' '.join(args))
         subprocess_logger = logger.context("Exec " + prog_tag)
         proc = subprocess.Popen(args, shell=False, stderr=subprocess.STDOUT,
-                                stdout=subprocess.PIPE, env=env, cwd=cwd)
+                                stdout=subprocess.PIPE, env=env, cwd=cwd, bufsize=1 << 16)
         # These are run in reverse order of registration
         # Terminate is first to allow for the possibility of graceful shutdown
         # Then the program will be forceably terminated and we restore the terminal settings
@@ -139,17 +159,7 @@ class HammerLocalSubmitCommand(HammerSubmitCommand):
         atexit.register(proc.kill)
         atexit.register(proc.terminate)
 
-        output_buf = ""
-        # Log output and also capture output at the same time.
-        so = proc.stdout
-        assert so is not None
-        while True:
-            line = so.readline().decode("utf-8")
-            if line != '':
-                subprocess_logger.debug(line.rstrip())
-                output_buf += line
-            else:
-                break
+        output_buf = self.capture_output(proc, subprocess_logger)
         # check errors
         proc.communicate()
 
@@ -224,7 +234,7 @@ class HammerLSFSubmitCommand(HammerSubmitCommand):
     def bsub_args(self) -> List[str]:
         args = [self.settings.bsub_binary, "-K"]  # always use -K to block
         args.extend(["-o", self.settings.log_file if self.settings.log_file is not None else
-            datetime.datetime.now().strftime("hammer-vlsi-bsub-%Y%m%d-%H%M%S.log")])  # always use -o to log to a file
+            time.strftime("hammer-vlsi-bsub-%Y%m%d-%H%M%S.log")])  # always use -o to log to a file
         if self.settings.queue is not None:
             args.extend(["-q", self.settings.queue])
         if self.settings.num_cpus is not None:
@@ -244,19 +254,9 @@ class HammerLSFSubmitCommand(HammerSubmitCommand):
         subprocess_logger = logger.context("Exec " + prog_tag)
         proc = subprocess.Popen(self.bsub_args() + [' '.join(args)],
                                 shell=False, stderr=subprocess.STDOUT,
-                                stdout=subprocess.PIPE, env=env, cwd=cwd)
+                                stdout=subprocess.PIPE, env=env, cwd=cwd, bufsize=1 << 16)
 
-        output_buf = ""
-        # Log output and also capture output at the same time.
-        so = proc.stdout
-        assert so is not None
-        while True:
-            line = so.readline().decode("utf-8")
-            if line != '':
-                subprocess_logger.debug(line.rstrip())
-                output_buf += line
-            else:
-                break
+        output_buf = self.capture_output(proc, subprocess_logger)
         # check errors
         proc.communicate()
 
@@ -7,6 +7,8 @@
 #  See LICENSE for licence details.
 
 from abc import abstractmethod
+from functools import lru_cache
+import re
 import sys
 try:
     from abc import ABC  # pylint: disable=ungrouped-imports
@@ -17,16 +19,25 @@ except ImportError:
         import abc  # pylint: disable=ungrouped-imports
         ABC = abc.ABCMeta('ABC', (object,), {'__slots__': ()})  # type: ignore
 
-from typing import Optional, TypeVar
+from typing import Optional, Pattern, TypeVar
 
 from hammer_utils import get_or_else
 
 _TT = TypeVar('_TT', bound='ValueWithUnit')
 
+
+@lru_cache(maxsize=None)
+def _value_regex(unit: str) -> Pattern[str]:
+    """Get the compiled regex used to parse values with the given base unit."""
+    return re.compile(r"^(-?[\d.]+) *(.*){}$".format(re.escape(unit)))
+
+
 class ValueWithUnit(ABC):
     """Represents some particular value that has units (e.g. "10 ns", "2000 um", "25 C", etc).
     """
 
+    __slots__ = ('_value', '_prefix', '_value_prefix')
+
     # From https://stackoverflow.com/a/10970888
     _prefix_table = {
         'y': 1e-24,  # yocto
@@ -77,12 +88,9 @@ class ValueWithUnit(ABC):
                        the given prefix, or the default prefix defined by the
                        class if one is not specified.
         """
-        import re
-
         default_prefix = get_or_else(prefix, self.default_prefix)
 
-        regex = r"^(-?[\d.]+) *(.*){}$".format(re.escape(self.unit))
-        match = re.search(regex, value)
+        match = _value_regex(self.unit).match(value)
         if match is None:
             try:
                 num = str(float(value))
@@ -255,6 +263,8 @@ class TimeValue(ValueWithUnit):
     Parses time values from strings.
     """
 
+    __slots__ = ()
+
     @property
     def default_prefix(self) -> str:
         """Default prefix: ns"""
@@ -273,6 +283,8 @@ class VoltageValue(ValueWithUnit):
     """Voltage value - e.g. "0.95 V", "950 mV".
     """
 
+    __slots__ = ()
+
     @property
     def default_prefix(self) -> str:
         """Default is plain volts (e.g. "0.1" -> 0.1 V)."""
@@ -292,6 +304,8 @@ class TemperatureValue(ValueWithUnit):
     Mainly used for specifying corners for MMMC.
     """
 
+    __slots__ = ()
+
     @property
     def default_prefix(self) -> str:
         """Default is plain degrees Celsius (e.g. "25" -> "25 C")."""
@@ -310,6 +324,8 @@ class CapacitanceValue(ValueWithUnit):
     """Capacitance value - e.g. "5 fF", "10 nF".
     """
 
+    __slots__ = ()
+
     @property
     def default_prefix(self) -> str:
         """Default prefix: fF"""
@@ -106,6 +106,16 @@ class HammerTechnologyTest(HasGetTech, unittest.TestCase):
         # Cleanup
         shutil.rmtree(tech_dir_base)
 
+    def test_filters_built_once(self) -> None:
+        """
+        Test that the predefined filters are built once per holder and returned as-is afterwards.
+        """
+        holder = hammer_tech.LibraryFilterHolder()
+        lef_filter = holder.lef_filter
+        self.assertIsInstance(lef_filter, LibraryFilter)
+        self.assertIs(holder.lef_filter, lef_filter)
+        self.assertIsNot(hammer_tech.LibraryFilterHolder().lef_filter, lef_filter)
+
     def test_process_library_filter_removes_duplicates(self) -> None:
         """
         Test that process_library_filter removes duplicates.
@@ -143,6 +153,49 @@ class HammerTechnologyTest(HasGetTech, unittest.TestCase):
         # Cleanup
         shutil.rmtree(tech_dir_base)
 
+    def test_read_libs_pre_filters_once(self) -> None:
+        """
+        Test that read_libs runs the pre-filters once per library, not once per library filter.
+        """
+        import hammer_config
+
+        tech_dir, tech_dir_base = HammerToolTestHelpers.create_tech_dir("dummy28")
+        tech_json_filename = os.path.join(tech_dir, "dummy28.tech.json")
+
+        def add_gds_library(in_dict: Dict[str, Any]) -> Dict[str, Any]:
+            out_dict = deepdict(in_dict)
+            out_dict["libraries"].append({
+                "name": "abcdef",
+                "gds file": "test/abcdef.gds",
+                "lef file": "test/abcdef.lef"
+            })
+            return out_dict
+
+        HammerToolTestHelpers.write_tech_json(tech_json_filename, add_gds_library)
+        sys.path.append(tech_dir_base)
+        tech = self.get_tech(hammer_tech.HammerTechnology.load_from_dir("dummy28", tech_dir))
+        tech.cache_dir = tech_dir
+        tech.logger = HammerVLSILogging.context("")
+
+        database = hammer_config.HammerDatabase()
+        tech.set_database(database)
+
+        checked = []  # type: List[hammer_tech.Library]
+
+        def count_pre_filter(lib: hammer_tech.Library) -> bool:
+            checked.append(lib)
+            return True
+
+        outputs = tech.read_libs([hammer_tech.filters.gds_filter, hammer_tech.filters.lef_filter],
+                                 hammer_tech.HammerTechnologyUtils.to_plain_item,
+                                 extra_pre_filters=[lambda lib: True, count_pre_filter],
+                                 must_exist=False)
+        self.assertEqual(outputs, ["{0}/abcdef.gds".format(tech_dir), "{0}/abcdef.lef".format(tech_dir)])
+        self.assertEqual(len(checked), len(tech.get_available_libraries()))
+
+        # Cleanup
+        shutil.rmtree(tech_dir_base)
+
     @staticmethod
     def add_tarballs(in_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -5,11 +5,13 @@
 #
 #  See LICENSE for licence details.
 
+import gc
 import json
 import os
 import shutil
 import tempfile
 import unittest
+import weakref
 from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 from decimal import Decimal
 
@@ -105,6 +107,29 @@ class HammerVLSILoggingTest(unittest.TestCase):
             ['[top] [A] ' + msgA, '[top] [B] ' + msgB]
         )
 
+    def test_min_level(self):
+        HammerVLSILogging.enable_buffering = True
+        HammerVLSILogging.enable_colour = False
+        HammerVLSILogging.enable_tag = True
+
+        HammerVLSILogging.clear_callbacks()
+        HammerVLSILogging.add_callback(HammerVLSILogging.callback_buffering)
+
+        log = HammerVLSILogging.context("test")
+
+        HammerVLSILogging.set_min_level(Level.WARNING)
+        try:
+            self.assertFalse(log.is_enabled_for(Level.INFO))
+            self.assertTrue(log.is_enabled_for(Level.ERROR))
+            log.debug("debug")
+            log.info("info")
+            log.warning("warning")
+            log.error("error")
+        finally:
+            HammerVLSILogging.set_min_level(Level.DEBUG)
+
+        self.assertEqual(HammerVLSILogging.get_buffer(), ['[test] warning', '[test] error'])
+
     def test_file_logging(self):
         fd, path = tempfile.mkstemp(".log")
         os.close(fd) # Don't leak file descriptors
@@ -127,6 +152,50 @@ class HammerVLSILoggingTest(unittest.TestCase):
         # Remove temp file
         os.remove(path)
 
+    def test_file_logging_flush(self):
+        fd, path = tempfile.mkstemp(".log")
+        os.close(fd) # Don't leak file descriptors
+
+        filelogger = HammerVLSIFileLogger(path)
+
+        HammerVLSILogging.clear_callbacks()
+        HammerVLSILogging.add_callback(filelogger.callback)
+        log = HammerVLSILogging.context()
+        log.info("Hello world")
+
+        # Warnings should be written out without waiting for the buffer to fill.
+        log.warning("Something looks off")
+        with open(path, 'r') as f:
+            self.assertEqual(f.read().strip(), """
+[<global>] Level.INFO: Hello world
+[<global>] Level.WARNING: Something looks off
+""".strip())
+
+        log.info("Buffered")
+        filelogger.flush()
+        with open(path, 'r') as f:
+            self.assertTrue(f.read().strip().endswith("[<global>] Level.INFO: Buffered"))
+
+        # Messages below WARNING are written out once the flush interval has passed.
+        old_interval = HammerVLSIFileLogger.flush_interval
+        HammerVLSIFileLogger.flush_interval = 0.0
+        try:
+            log.info("On time")
+            with open(path, 'r') as f:
+                self.assertTrue(f.read().strip().endswith("[<global>] Level.INFO: On time"))
+        finally:
+            HammerVLSIFileLogger.flush_interval = old_interval
+        filelogger.close()
+        HammerVLSILogging.clear_callbacks()
+
+        # Loggers which are never closed are not kept alive.
+        logger_ref = weakref.ref(HammerVLSIFileLogger(path))
+        gc.collect()
+        self.assertIsNone(logger_ref())
+
+        # Remove temp file
+        os.remove(path)
+
 
 class HammerToolTest(HasGetTech, unittest.TestCase):
     def test_read_libs(self) -> None:
@@ -856,6 +925,35 @@ export lol=abc"cat"
         shutil.rmtree(tech_dir_base)
         shutil.rmtree(tmpdir)
 
+    def test_input_files_setter(self) -> None:
+        """
+        Test that input_files accepts any iterable, and only reports non-iterables as the wrong type.
+        """
+        tool = hammer_vlsi.DummyHammerTool()
+        tool.input_files = (f for f in ["a.v", "b.v"])
+        self.assertEqual(list(tool.input_files), ["a.v", "b.v"])
+        self.assertEqual(list(tool.input_files), ["a.v", "b.v"])
+        with self.assertRaisesRegex(TypeError, "must be a Iterable"):
+            tool.input_files = 1  # type: ignore
+
+        def bad_files():
+            yield "a.v"
+            raise TypeError("bad file")
+
+        with self.assertRaisesRegex(TypeError, "bad file"):
+            tool.input_files = bad_files()
+
+    def test_verbose_tcl_append(self) -> None:
+        """
+        Test that verbose_tcl_append escapes the echoed command.
+        """
+        output = []  # type: List[str]
+        hammer_vlsi.HammerTool.verbose_tcl_append('set_db foo "a\\b"', output)
+        self.assertEqual(output, ['puts "set_db foo \\"a\\\\b\\"" ', 'set_db foo "a\\b"'])
+        output = []
+        hammer_vlsi.HammerTool.verbose_tcl_append('set_db foo [get_db $bar]', output)
+        self.assertEqual(output, ['puts "set_db foo \\[get_db \\$bar]" ', 'set_db foo [get_db $bar]'])
+
 
 T = TypeVar('T')
 
@@ -2166,6 +2264,18 @@ class HammerSimToolTest(unittest.TestCase):
             # Ignore typing here because this is part of the mocksim API
             self.assertTrue(os.path.exists(c.driver.sim_tool.force_regs_file_path))  # type: ignore
 
+    def test_input_files_copied(self) -> None:
+        """Test that modifying a tool's input_files does not modify the database's setting."""
+        with self.create_context() as c:
+            self.assertTrue(c.driver.load_sim_tool())
+            sim_tool = c.driver.sim_tool
+            assert isinstance(sim_tool, hammer_vlsi.HammerSimTool)
+            input_files = c.driver.database.get_setting("sim.inputs.input_files")
+            sim_tool.input_files = input_files
+            sim_tool.input_files.append("/dev/zero")
+            self.assertEqual(input_files, ["/dev/null"])
+            self.assertEqual(sim_tool.input_files, ["/dev/null", "/dev/zero"])
+
 
 if __name__ == '__main__':
     unittest.main()
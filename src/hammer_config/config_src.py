@@ -10,18 +10,29 @@
 # pylint: disable=invalid-name
 
 from decimal import Decimal
-from typing import Iterable, List, Union, Callable, Any, Dict, Set, NamedTuple, Tuple, Optional
+from typing import Iterable, List, Union, Callable, Any, Dict, Set, NamedTuple, Tuple, Optional, Pattern
 from warnings import warn
 from enum import Enum
 
 from hammer_utils import deepdict, topological_sort
 from .yaml2json import load_yaml  # grumble grumble
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce, lru_cache
+from itertools import chain
+import copy
 import json
+import math
 import numbers
 import os
 import re
+import time
+
+# Use orjson to load configs and dump the database if present, since it is much faster for large configs.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 # A helper class that writes Decimals as strings
 # TODO(ucb-bar/hammer#378) get rid of this and serialize units
@@ -35,10 +46,18 @@ class HammerJSONEncoder(json.JSONEncoder):
 # Special key used for meta directives which require config paths like prependlocal.
 _CONFIG_PATH_KEY = "_config_path"
 
+# Parsed config files, keyed by (absolute path, mtime in ns, size).
+_CONFIG_FILE_CACHE = {}  # type: Dict[Tuple[str, int, int], dict]
+# Minimum age (in seconds) of a config file before it is cached.
+_CONFIG_FILE_CACHE_MIN_AGE = 2.0
+
 # Special key used to keep track of the next available integer suffix to avoid
 # duplicate keys.
 _NEXT_FREE_INDEX_KEY = "_next_free_index"
 
+# Internal keys that shouldn't show up in any final config.
+_INTERNAL_KEYS = frozenset([_CONFIG_PATH_KEY, _NEXT_FREE_INDEX_KEY])
+
 
 def _get_next_free_index(d: dict) -> int:
     """
@@ -137,24 +156,22 @@ DeepSubstMetaDirectives = {
     "transclude": deepsubst_transclude
 }  # type: Dict[str, Callable[[str, MetaDirectiveParams], str]]
 
-@lru_cache(maxsize=2)
-def get_meta_directives() -> Dict[str, MetaDirective]:
+def _build_meta_directives() -> Dict[str, MetaDirective]:
     """
-    Get all meta directives available.
+    Build all meta directives available.
     :return: Meta directives indexed by action (e.g. "subst").
     """
     directives = {}  # type: Dict[str, MetaDirective]
 
     # Helper functions to implement each meta directive.
     def append_action(config_dict: dict, key: str, value: Any, params: MetaDirectiveParams) -> None:
-        if key not in config_dict:
-            config_dict[key] = []
+        current_list = config_dict.setdefault(key, [])
 
-        if not isinstance(config_dict[key], list):
+        if not isinstance(current_list, list):
             raise ValueError(f"Trying to append to non-list setting {key}")
         if not isinstance(value, list):
             raise ValueError(f"Trying to append to list {key} with non-list {value}")
-        config_dict[key] += value
+        current_list.extend(value)
 
     def append_rename(key: str, value: Any, target_setting: str, replacement_setting: str) -> Optional[Tuple[Any, str]]:
         return [replacement_setting, value], "crossappend"
@@ -236,7 +253,9 @@ def get_meta_directives() -> Dict[str, MetaDirective]:
 
     def subst_str(input_str: str, replacement_func: Callable[[str], str]) -> str:
         """Substitute ${...}"""
-        return re.sub(__VARIABLE_EXPANSION_REGEX, lambda x: replacement_func(x.group(1)), input_str)
+        if "${" not in input_str:
+            return input_str
+        return __VARIABLE_EXPANSION_REGEX.sub(lambda x: replacement_func(x.group(1)), input_str)
 
     def subst_action(config_dict: dict, key: str, value: Any, params: MetaDirectiveParams) -> None:
         def perform_subst(value: Union[str, List[str]]) -> Union[str, List[str]]:
@@ -248,11 +267,19 @@ def get_meta_directives() -> Dict[str, MetaDirective]:
             :return: String or list but with everything substituted.
             """
             newval = ""  # type: Union[str, List[str]]
+            lookup = config_dict.__getitem__
 
             if isinstance(value, list):
-                newval = list(map(lambda input_str: subst_str(input_str, lambda key: config_dict[key]), value))
+                # Substitute the whole list in one pass by joining it on a sentinel, unless the sentinel
+                # shows up in the list itself or in one of the substituted values.
+                sentinel = "\x00"
+                if not any(sentinel in input_str for input_str in value):
+                    newval = subst_str(sentinel.join(value), lookup).split(sentinel)
+                    if len(newval) == len(value):
+                        return newval
+                newval = [subst_str(input_str, lookup) for input_str in value]
             else:
-                newval = subst_str(value, lambda key: config_dict[key])
+                newval = subst_str(value, lookup)
             return newval
 
         config_dict[key] = perform_subst(value)
@@ -271,14 +298,9 @@ def get_meta_directives() -> Dict[str, MetaDirective]:
         else:
             raise ValueError(f"subst must operate on a str or List[str]; got {value} instead")
 
-        output_vars = []  # type: List[str]
-
-        for subst_value in subst_strings:
-            matches = re.finditer(__VARIABLE_EXPANSION_REGEX, subst_value, re.DOTALL)
-            for match in matches:
-                output_vars.append(match.group(1))
-
-        return output_vars
+        return [target
+                for subst_value in subst_strings
+                for target in _variable_references(subst_value)]
 
     def subst_rename(key: str, value: Any, target_setting: str, replacement_setting: str) -> Optional[Tuple[Any, str]]:
         assert isinstance(value, str)
@@ -286,7 +308,8 @@ def get_meta_directives() -> Dict[str, MetaDirective]:
         if target_setting not in subst_targets(key, value):
             return None
 
-        new_value = subst_str(value, lambda key: "${" + replacement_setting + "}" if key == target_setting else key)
+        # Renaming only swaps one literal ${...} token, so there is no need to run the regex substitution again.
+        new_value = value.replace("${" + target_setting + "}", "${" + replacement_setting + "}")
         return new_value, "subst"
 
     directives['subst'] = MetaDirective(action=subst_action,
@@ -307,10 +330,7 @@ def get_meta_directives() -> Dict[str, MetaDirective]:
         if isinstance(value, str):
             config_dict[key] = config_dict[value]
         elif isinstance(value, list):
-            def check_and_get(k: Any) -> Any:
-                return config_dict[crossref_check_and_cast(k)]
-
-            config_dict[key] = list(map(check_and_get, value))
+            config_dict[key] = [config_dict[crossref_check_and_cast(k)] for k in value]
         elif isinstance(value, numbers.Number):
             # bools are instances of numbers.Number for some weird reason
             raise ValueError("crossref cannot be used with numbers and bools")
@@ -337,7 +357,7 @@ def get_meta_directives() -> Dict[str, MetaDirective]:
         if isinstance(value, str):
             return [change_if_target(value)], "crossref"
         if isinstance(value, list):
-            return list(map(change_if_target, map(crossref_check_and_cast, value))), "crossref"
+            return [change_if_target(crossref_check_and_cast(x)) for x in value], "crossref"
         if isinstance(value, numbers.Number):
             # bools are instances of numbers.Number for some weird reason
             raise ValueError("crossref cannot be used with numbers and bools")
@@ -407,10 +427,12 @@ def get_meta_directives() -> Dict[str, MetaDirective]:
         Perform a deep substitution on the value provided. This will replace any variables that occur in strings
         of the form ${...} and will also do a special meta replacement on keys which end in _deepsubst_meta.
         """
+        lookup = config_dict.__getitem__
+
         def do_subst(oldval: Any) -> Any:
             if isinstance(oldval, str):
                 # This is just regular subst
-                return subst_str(oldval, lambda key: config_dict[key])
+                return subst_str(oldval, lookup)
             if isinstance(oldval, list):
                 return list(map(do_subst, oldval))
             if isinstance(oldval, dict):
@@ -485,6 +507,22 @@ def get_meta_directives() -> Dict[str, MetaDirective]:
     return directives
 
 
+# The meta directives never change, so they are built once at import.
+_META_DIRECTIVES = _build_meta_directives()  # type: Dict[str, MetaDirective]
+# target_settings functions of the meta directives, for looking up dependencies between lazy settings.
+_META_TARGET_SETTINGS = {meta_type: directive.target_settings
+                         for meta_type, directive in _META_DIRECTIVES.items()
+                         }  # type: Dict[str, Callable[[str, Any], List[str]]]
+
+
+def get_meta_directives() -> Dict[str, MetaDirective]:
+    """
+    Get all meta directives available.
+    :return: Meta directives indexed by action (e.g. "subst").
+    """
+    return _META_DIRECTIVES
+
+
 def unpack(config_dict: dict, prefix: str = "") -> dict:
     """
     Unpack the given config_dict, flattening key names recursively.
@@ -511,14 +549,26 @@ def unpack(config_dict: dict, prefix: str = "") -> dict:
     ...     "b.boom.hwacha": "vector"}
     True
     """
-    # We don't want an extra "." in the beginning.
-    real_prefix = "" if prefix == "" else prefix + "."
     output_dict = {}
-    for key, value in config_dict.items():
-        if isinstance(value, dict):
-            output_dict.update(unpack(value, real_prefix + key))
+    # Walk the nested dicts depth-first with an explicit stack of (prefix, items) so that keys come out in the same
+    # order as a recursive walk, without building and merging an intermediate dict per level.
+    stack = [(prefix, iter(config_dict.items()))]
+    while stack:
+        current_prefix, items = stack[-1]
+        for key, value in items:
+            # We don't want an extra "." in the beginning.
+            full_key = key if current_prefix == "" else current_prefix + "." + key
+            if isinstance(value, dict):
+                if any(isinstance(v, dict) for v in value.values()):
+                    stack.append((full_key, iter(value.items())))
+                    break
+                # Leaf-only dicts (the common case) are flattened in one go.
+                leaf_prefix = full_key + "." if full_key != "" else ""
+                output_dict.update({leaf_prefix + k: v for k, v in value.items()})
+                continue
+            output_dict[full_key] = value
         else:
-            output_dict[real_prefix + key] = value
+            stack.pop()
     return output_dict
 
 
@@ -528,29 +578,38 @@ def reverse_unpack(input_dict: dict) -> dict:
     >>> p = reverse_unpack({"a.b": 1})
     >>> p == {"a": {"b": 1}}
     True
+
     :param input: Unpacked input_dict dictionary
     :return: Packed equivalent of input_dict
     """
     output_dict = {}  # type: Dict[str, Any]
 
-    def get_subdict(parts: List[str], current_root: dict) -> dict:
-        if len(parts) == 0:
-            return current_root
-        if parts[0] not in current_root:
-            current_root[parts[0]] = {}
-        return get_subdict(parts[1:], current_root[parts[0]])
-
     for key, value in input_dict.items():
-        key_parts = key.split(".")
-        if len(key_parts) >= 1:
-            containing_dict = get_subdict(key_parts[:-1], output_dict)
-        else:
-            assert False, "Cannot have blank key"
-        containing_dict[key_parts[-1]] = value
+        *parent_parts, last_part = key.split(".")
+        # Walk down (creating as needed) the dicts containing this key.
+        containing_dict = output_dict
+        for part in parent_parts:
+            containing_dict = containing_dict.setdefault(part, {})
+        containing_dict[last_part] = value
     return output_dict
 
 
-__VARIABLE_EXPANSION_REGEX = r'\${([a-zA-Z_\-\d.]+)}'
+__VARIABLE_EXPANSION_REGEX = re.compile(r'\${([a-zA-Z_\-\d.]+)}')  # type: Pattern[str]
+
+
+@lru_cache(maxsize=1024)
+def _variable_references(input_str: str) -> Tuple[str, ...]:
+    """
+    Get the names of all ${...} variables referenced in the given string.
+    The same lazy values are scanned once per config layer and again on every
+    config rebuild, so the results are cached by string.
+
+    :param input_str: String to scan.
+    :return: Referenced variable names, in order of appearance.
+    """
+    if "${" not in input_str:
+        return ()
+    return tuple(match.group(1) for match in __VARIABLE_EXPANSION_REGEX.finditer(input_str))
 
 
 def update_and_expand_meta(config_dict: dict, meta_dict: dict) -> dict:
@@ -565,17 +624,24 @@ def update_and_expand_meta(config_dict: dict, meta_dict: dict) -> dict:
     assert isinstance(config_dict, dict)
     assert isinstance(meta_dict, dict)
 
+    # Deep copy since meta actions (e.g. append) modify existing values in place.
     newdict = deepdict(config_dict)
 
     # Find meta directives.
-    meta_dict = deepdict(meta_dict)  # create a copy so we can remove items.
-    meta_dict_keys = list(meta_dict.keys())
-    meta_keys = filter(lambda k: k.endswith("_meta"), meta_dict_keys)
+    # Only top-level items are replaced, so a shallow copy is enough. Values from meta_dict are deep-copied
+    # where they are stored into newdict, so the result never shares objects with the input layer.
+    meta_dict = dict(meta_dict)
+    meta_len = len("_meta")
+    lazy_len = len("lazy")
+    # (meta key, setting) pairs, collected up front since items in meta_dict are replaced below.
+    meta_pairs = [(k, k[:-meta_len]) for k in meta_dict if k.endswith("_meta")]
+    # Keys handled by the meta directives, which are skipped when copying everything else at the end.
+    meta_handled_keys = {key for pair in meta_pairs for key in pair}
 
     # Deal with meta directives.
-    meta_len = len("_meta")
-    for meta_key in meta_keys:
-        setting = meta_key[:-meta_len]
+    directives = _META_DIRECTIVES
+    params = MetaDirectiveParams(meta_path=meta_dict.get(_CONFIG_PATH_KEY, "unspecified"))
+    for meta_key, setting in meta_pairs:
         meta_type_from_dict = meta_dict[meta_key]  # type: Union[str, List[str]]
         meta_directives = []  # type: List[str]
         if isinstance(meta_type_from_dict, str):
@@ -599,28 +665,30 @@ def update_and_expand_meta(config_dict: dict, meta_dict: dict) -> dict:
                     "Dynamic meta directives were renamed to lazy meta directives after issue #134. "
                     "Please change your metas from dynamic* to lazy*")
             if meta_type.startswith("lazy"):
-                lazy_base_meta_type = meta_type[len("lazy"):]
+                lazy_base_meta_type = meta_type[lazy_len:]
 
-                if lazy_base_meta_type not in get_meta_directives():
-                    raise ValueError(f"The type of lazy meta variable {meta_key} is not supported ({meta_type})" % (meta_key, meta_type))
+                if lazy_base_meta_type not in directives:
+                    raise ValueError(f"The type of lazy meta variable {meta_key} is not supported ({meta_type})")
 
                 if seen_lazy:
                     raise ValueError("Multiple lazy directives in a single directive array not supported yet")
                 seen_lazy = True
 
                 update_dict = {}  # type: dict
+                lazy_directive = directives[lazy_base_meta_type]
+                current_value = copy.deepcopy(meta_dict[setting])
 
                 # Check if this lazy meta references itself by checking if any of its targets is itself.
-                targets = get_meta_directives()[lazy_base_meta_type].target_settings(setting, meta_dict[setting])
-                if len(list(filter(lambda x: x == setting, targets))) > 0:
+                targets = lazy_directive.target_settings(setting, current_value)
+                if setting in targets:
                     # If it does, rename this lazy meta to reference a new base.
                     # e.g. if a (dict 2) -> a (dict 1), rename "a (dict 1)" to a_1.
                     next_index = _get_next_free_index(newdict)
                     new_base_setting = f"{setting}_{next_index}"
-                    new_value_meta = get_meta_directives()[lazy_base_meta_type].rename_target(setting,
-                                                                                              meta_dict[setting],
-                                                                                              setting,
-                                                                                              new_base_setting)  # type: Optional[Tuple[Any, str]]
+                    new_value_meta = lazy_directive.rename_target(setting,
+                                                                  current_value,
+                                                                  setting,
+                                                                  new_base_setting)  # type: Optional[Tuple[Any, str]]
                     if new_value_meta is None:
                         raise ValueError(
                             f"Failed to rename lazy setting which depends on itself ({setting})")
@@ -639,7 +707,7 @@ def update_and_expand_meta(config_dict: dict, meta_dict: dict) -> dict:
                 else:
                     # Store it into newdict and skip processing now.
                     update_dict.update({
-                        setting: meta_dict[setting],
+                        setting: current_value,
                         setting + "_meta": meta_type
                     })
                 newdict.update(update_dict)
@@ -648,21 +716,62 @@ def update_and_expand_meta(config_dict: dict, meta_dict: dict) -> dict:
                 raise ValueError("Cannot use a non-lazy meta directive after a lazy one")
 
             try:
-                meta_func = get_meta_directives()[meta_type].action
+                meta_func = directives[meta_type].action
             except KeyError as exc:
                 raise ValueError(f"The type of meta variable {meta_key} is not supported ({meta_type})") from exc
-            meta_func(newdict, setting, meta_dict[setting],
-                      MetaDirectiveParams(meta_path=meta_dict.get(_CONFIG_PATH_KEY, "unspecified")))
+            # Actions may store the value (or parts of it) as-is, e.g. append extends a list with its elements.
+            meta_func(newdict, setting, copy.deepcopy(meta_dict[setting]), params)
             # Update meta_dict if there are multiple meta directives.
             meta_dict[setting] = newdict[setting]
 
-        del meta_dict[meta_key]
-        del meta_dict[setting]
-
-    newdict.update(deepdict(meta_dict))  # Update everything else.
+    # Update everything else.
+    newdict.update(deepdict({k: v for k, v in meta_dict.items() if k not in meta_handled_keys}))
     return newdict
 
 
+def _dump_database_json(config: dict) -> str:
+    """
+    Dump the given config to a JSON string with sorted keys.
+    Uses orjson if it is available, falling back to json for anything orjson can't write as-is: non-finite numbers
+    (which orjson writes as null) and integers over 64 bits.
+    The values are the same either way, but the two format them differently: orjson only supports an indent of 2
+    (json keeps the usual 4), spells some numbers differently (e.g. 1e-7 vs 1e-07) and doesn't escape non-ASCII
+    characters, so the result has to be written out as UTF-8.
+    """
+    if orjson is not None and not _has_non_finite_number(config):
+        try:
+            # Write Decimals as floats, like HammerJSONEncoder.
+            return orjson.dumps(config, default=_decimal_to_float,
+                                option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    # The cls=HammerJSONEncoder enables writing Decimals
+    return json.dumps(config, cls=HammerJSONEncoder, sort_keys=True, indent=4, separators=(',', ': '))
+
+
+def _has_non_finite_number(value: Any) -> bool:
+    """Check if the given value contains any NaN or infinite floats or Decimals."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, Decimal):
+        return not value.is_finite()
+    if isinstance(value, dict):
+        return any(_has_non_finite_number(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_number(v) for v in value)
+    return False
+
+
+def _decimal_to_float(o: Any) -> float:
+    if isinstance(o, Decimal):
+        return float(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# Settings which are exempt from the type checks in HammerDatabase.get_setting().
+_UNCHECKED_SETTINGS = frozenset(["vlsi.builtins.hammer_vlsi_path", "vlsi.builtins.is_complete"])
+
+
 class HammerDatabase:
     """
     Define a database which is composed of a set of overridable configs.
@@ -695,6 +804,12 @@ class HammerDatabase:
 
         self.__config_cache = {}  # type: dict
         self.__config_cache_dirty = False  # type: bool
+        # JSON dump of the config cache, or None if it has not been generated yet.
+        self.__config_json_cache = None  # type: Optional[str]
+        # Cache of get_setting() lookups, keyed by (key, check_type).
+        self.__setting_cache = {}  # type: Dict[Tuple[str, bool], Any]
+        # Settings which are lazy or referenced by a lazy setting in the config cache.
+        self.__lazy_settings = set()  # type: Set[str]
 
         self.__config_types = {}  # type: dict
 
@@ -705,17 +820,18 @@ class HammerDatabase:
     @staticmethod
     def internal_keys() -> Set[str]:
         """Internal keys that shouldn't show up in any final config."""
-        return {_CONFIG_PATH_KEY, _NEXT_FREE_INDEX_KEY}
+        return set(_INTERNAL_KEYS)
 
     def get_config(self) -> dict:
         """
         Get the config of this database after all the overrides have been dealt with.
         """
         if self.__config_cache_dirty:
-            self.__config_cache = combine_configs(
-                [{}] + self.builtins + self.core + self.tools + self.technology + self.environment +
-                self.project + self.runtime)
+            self.__config_cache, self.__lazy_settings = _combine_configs(chain(
+                self.builtins, self.core, self.tools, self.technology, self.environment, self.project, self.runtime))
             self.__config_cache_dirty = False
+            self.__config_json_cache = None
+            self.__setting_cache = {}
         return self.__config_cache
 
     def get_config_types(self) -> dict:
@@ -727,8 +843,10 @@ class HammerDatabase:
     def get_database_json(self) -> str:
         """Get the database (get_config) in JSON form as a string.
         """
-        # The cls=HammerJSONEncoder enables writing Decimals
-        return json.dumps(self.get_config(), cls=HammerJSONEncoder, sort_keys=True, indent=4, separators=(',', ': '))
+        config = self.get_config()
+        if self.__config_json_cache is None:
+            self.__config_json_cache = _dump_database_json(config)
+        return self.__config_json_cache
 
     def get(self, key: str) -> Any:
         """Alias for get_setting()."""
@@ -751,21 +869,22 @@ class HammerDatabase:
         :param check_type: Flag to enforce type checking
         :return: The given config
         """
-        cfg_path = os.path.join(os.path.dirname(__file__), "..", "hammer-vlsi")
-        defaults = unpack(load_config_from_defaults(cfg_path)[1])
-
-        IGNORE = ["vlsi.builtins.hammer_vlsi_path", "vlsi.builtins.is_complete"]
-        if key not in self.get_config():
-            raise KeyError("Key " + key + " is missing")
-        if key not in IGNORE and key not in defaults:
-            # warn(f"Key {key} does not have a default implementation")
-            pass
-        if check_type and key not in IGNORE:
-            if key not in self.get_config_types():
-                warn(f"Key {key} is not associated with a type")
-            else:
+        config = self.get_config()
+        # Lookups (including type checks) are cached until the config or types change.
+        cache_key = (key, check_type)
+        if cache_key in self.__setting_cache:
+            value = self.__setting_cache[cache_key]
+        else:
+            if key not in config:
+                raise KeyError("Key " + key + " is missing")
+            value = config[key]
+            if check_type and key not in _UNCHECKED_SETTINGS:
+                if key not in self.get_config_types():
+                    warn(f"Key {key} is not associated with a type")
+                    # Not cached, so that the warning is given for every lookup.
+                    return nullvalue if value is None else value
                 self.check_setting(key)
-        value = self.get_config()[key]
+            self.__setting_cache[cache_key] = value
         return nullvalue if value is None else value
 
     def set_setting(self, key: str, value: Any) -> None:
@@ -776,7 +895,25 @@ class HammerDatabase:
         :param value: Value for key
         """
         self._runtime[key] = value
-        self.__config_cache_dirty = True
+        if self.__config_cache_dirty or not self.__can_update_in_place(key):
+            self.__config_cache_dirty = True
+        else:
+            # Runtime settings are applied last, so only this key of the combined config changes.
+            # Patch a shallow copy rather than the cached dict itself: get_config() hands that dict out, and a caller
+            # holding or iterating over it should keep seeing the config as it was, like after a full rebuild.
+            new_config = dict(self.__config_cache)
+            new_config[key] = copy.deepcopy(value)
+            self.__config_cache = new_config
+            self.__config_json_cache = None
+            self.__setting_cache = {}
+
+    def __can_update_in_place(self, key: str) -> bool:
+        """
+        Check if setting the given runtime key can be applied directly to the config cache, i.e. it does not involve
+        any meta directives (its own or lazy ones which reference it), so combine_configs need not be re-run.
+        """
+        return not key.endswith("_meta") and key + "_meta" not in self._runtime and \
+            key not in self.__lazy_settings and key not in _INTERNAL_KEYS
 
     def has_setting(self, key: str) -> bool:
         """
@@ -809,6 +946,7 @@ class HammerDatabase:
         """
         self.__config_types[key] = value
         self.__config_cache_dirty = True
+        self.__setting_cache = {}
 
     def has_setting_type(self, key: str) -> bool:
         """
@@ -907,6 +1045,7 @@ class HammerDatabase:
         """
         loaded_cfg = combine_configs(config_types)
         self.__config_types = loaded_cfg
+        self.__setting_cache = {}
         if check_type:
             for k, v in loaded_cfg.items():
                 if not self.has_setting(k):
@@ -914,6 +1053,24 @@ class HammerDatabase:
                 elif k != "_config_path":
                     self.check_setting(k)
 
+# Numbers which might not fit in 64 bits.
+_LONG_NUMBER_REGEX = re.compile(r'\d{19}')  # type: Pattern[str]
+
+
+def _json_loads(contents: str) -> Any:
+    """
+    Parse the given JSON string, using orjson if it is available.
+    Falls back to json for anything orjson rejects (e.g. NaN), which also produces the usual error messages for
+    invalid JSON, and for long numbers since orjson turns integers over 64 bits into floats.
+    """
+    if orjson is not None and _LONG_NUMBER_REGEX.search(contents) is None:
+        try:
+            return orjson.loads(contents)
+        except ValueError:
+            pass
+    return json.loads(contents)
+
+
 def load_config_from_string(contents: str, is_yaml: bool, path: str = "unspecified") -> dict:
     """
     Load config from a string by loading it and unpacking it.
@@ -923,7 +1080,9 @@ def load_config_from_string(contents: str, is_yaml: bool, path: str = "unspecifi
     :param path: Path to the folder where the config file is located.
     :return: Loaded config dictionary, unpacked.
     """
-    unpacked = unpack(load_yaml(contents) if is_yaml else json.loads(contents))
+    loaded = load_yaml(contents) if is_yaml else _json_loads(contents)
+    # Configs which are already flat (e.g. output configs) don't need to be unpacked.
+    unpacked = loaded if not any(isinstance(v, dict) for v in loaded.values()) else unpack(loaded)
     unpacked[_CONFIG_PATH_KEY] = path
     return unpacked
 
@@ -938,7 +1097,7 @@ def load_config_from_file(filename: str, strict: bool = False) -> dict:
     :param strict: Set to true to error if the file is not found.
     :return: Loaded config dictionary, unpacked.
     """
-    if filename.endswith(".yml") or filename.endswith(".yaml"):
+    if filename.endswith((".yml", ".yaml")):
         is_yaml = True
     elif filename.endswith(".json"):
         is_yaml = False
@@ -946,17 +1105,38 @@ def load_config_from_file(filename: str, strict: bool = False) -> dict:
         raise ValueError("Invalid config type " + filename)
 
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            file_contents = f.read()
+        stat = os.stat(filename)
     except FileNotFoundError as e:
         if strict:
             raise e
         # If the config didn't exist, just return a blank dictionary.
         return {}
 
-    if file_contents.strip() == "":
-        return {}
-    return load_config_from_string(file_contents, is_yaml, path=os.path.dirname(filename))
+    cache_key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+    config = _CONFIG_FILE_CACHE.get(cache_key)
+    if config is None:
+        with open(filename, "r", encoding="utf-8") as f:
+            file_contents = f.read()
+        if file_contents.strip() == "":
+            config = {}
+        else:
+            config = load_config_from_string(file_contents, is_yaml)
+        # A file modified very recently could be modified again without changing its mtime or size, so only cache
+        # it once it has settled.
+        if time.time() - stat.st_mtime > _CONFIG_FILE_CACHE_MIN_AGE:
+            _CONFIG_FILE_CACHE[cache_key] = config
+    config = copy.deepcopy(config)
+    if len(config) > 0:
+        # The same file can be reached through different relative paths.
+        config[_CONFIG_PATH_KEY] = os.path.dirname(filename)
+    return config
+
+
+def clear_config_file_cache() -> None:
+    """
+    Forget all config files parsed by load_config_from_file.
+    """
+    _CONFIG_FILE_CACHE.clear()
 
 
 def combine_configs(configs: Iterable[dict]) -> dict:
@@ -968,87 +1148,120 @@ def combine_configs(configs: Iterable[dict]) -> dict:
     :param handle_meta: Handle meta configs?
     :return: A loaded config dictionary.
     """
-    expanded_config_reduce = reduce(update_and_expand_meta, configs, {})  # type: dict
-    expanded_config = deepdict(expanded_config_reduce)  # type: dict
-    expanded_config_orig = deepdict(expanded_config)  # type: dict
+    return _combine_configs(configs)[0]
+
+
+def _find_lazy_loop(graph: Dict[str, Tuple[List[str], List[str]]], settings_ordered: List[str]) -> List[str]:
+    """
+    Find a loop among the lazy settings which the topological sort could not order.
+
+    :param graph: Lazy settings graph (see _combine_configs).
+    :param settings_ordered: Settings which were ordered.
+    :return: Settings in the loop, each depending on the next, starting and ending with the same setting.
+    """
+    remaining = set(graph).difference(settings_ordered)
+    # Every remaining setting depends on another remaining setting, so following those dependencies has to
+    # eventually come back to a setting already seen.
+    setting = min(remaining)
+    path = []  # type: List[str]
+    path_index = {}  # type: Dict[str, int]
+    while setting not in path_index:
+        path_index[setting] = len(path)
+        path.append(setting)
+        setting = next(dependency for dependency in graph[setting][1] if dependency in remaining)
+    return path[path_index[setting]:] + [setting]
+
+
+def _combine_configs(configs: Iterable[dict]) -> Tuple[dict, Set[str]]:
+    """
+    Implementation of combine_configs.
+
+    :param configs: List of configs.
+    :return: Tuple of (loaded config dictionary, settings which are lazy or are referenced by lazy settings).
+    """
+    # update_and_expand_meta always returns a new dict which shares no objects with its inputs, so this can be
+    # modified (and returned) without copying it.
+    expanded_config = reduce(update_and_expand_meta, configs, {})  # type: dict
 
     # Now, we need to handle lazy* metas.
     lazy_metas = {}
 
-    meta_dict_keys = list(expanded_config.keys())
-    meta_keys = list(filter(lambda k: k.endswith("_meta"), meta_dict_keys))
+    meta_len = len("_meta")
+    lazy_len = len("lazy")
+    # (meta key, setting) pairs of the lazy settings left to expand.
+    meta_pairs = [(k, k[:-meta_len]) for k in expanded_config if k.endswith("_meta")]
+    if not meta_pairs:
+        # No lazy settings, so there is nothing left to expand.
+        for key in _INTERNAL_KEYS:
+            expanded_config.pop(key, None)
+        return expanded_config, set()
+    meta_keys = {meta_key for meta_key, _ in meta_pairs}
 
     # Graph to keep track of which lazy settings depend on others.
     # key1 -> key2 means key2 depends on key1
     graph = {}  # type: Dict[str, Tuple[List[str], List[str]]]
+    # All lazy settings and the settings they reference.
+    lazy_settings = set()  # type: Set[str]
 
-    meta_len = len("_meta")
-    for meta_key in meta_keys:
-        setting = meta_key[:-meta_len]  # type: str
+    target_settings_funcs = _META_TARGET_SETTINGS
+    for meta_key, setting in meta_pairs:
         lazy_meta_type = expanded_config[meta_key]  # type: str
 
         assert lazy_meta_type.startswith("lazy"), "Should have only lazy metas left now"
 
         # Create lazy_metas without the lazy part.
         # e.g. what used to be a lazysubst just becomes a plain subst since everything is fully resolved now.
-        meta_type = lazy_meta_type[len("lazy"):]
+        meta_type = lazy_meta_type[lazy_len:]
+        template = expanded_config[setting]
         lazy_metas[meta_key] = meta_type
-        lazy_metas[setting] = expanded_config[setting]  # copy over the template too
+        lazy_metas[setting] = template  # copy over the template too
 
         # Build the graph of which lazy settings depend on what.
 
         # Always ensure that this lazy setting's node exists even if it has no dependencies.
         if setting not in graph:
             graph[setting] = ([], [])
+        setting_dependencies = graph[setting][1]
+        lazy_settings.add(setting)
 
-        for target_var in get_meta_directives()[meta_type].target_settings(setting, expanded_config[setting]):
-            # Make sure the order in which we delete doesn't affect this
-            # search, since expanded_config might have some deleted stuff.
-            if target_var + "_meta" in expanded_config_orig:
+        for target_var in target_settings_funcs[meta_type](setting, template):
+            lazy_settings.add(target_var)
+            if target_var + "_meta" in meta_keys:
                 # Add a dependency for target -> this setting
                 if target_var not in graph:
                     graph[target_var] = ([], [])
                 graph[target_var][0].append(setting)
-                graph[setting][1].append(target_var)
+                setting_dependencies.append(target_var)
             else:
                 # The target setting that this depends on is not a lazy setting.
                 pass
 
-        # Delete from expanded_config
-        del expanded_config[meta_key]
-        del expanded_config[setting]
-
-    if len(graph) > 0:
-        # Find all the starting nodes (no incoming edges).
-        starting_nodes = list(
-            map(lambda key_val: key_val[0], filter(lambda key_val: len(key_val[1][1]) == 0, graph.items())))
+    # Remove the lazy settings and their metas in one pass; they are added back below.
+    expanded_config = {k: v for k, v in expanded_config.items() if k not in lazy_metas}
 
-        # Sort starting nodes for determinism.
-        starting_nodes = sorted(starting_nodes)
+    # Find all the starting nodes (no incoming edges), sorted for determinism.
+    starting_nodes = sorted(key for key, (_, dependencies) in graph.items() if not dependencies)
 
-        if len(starting_nodes) == 0:
-            raise ValueError("There appears to be a loop of lazy settings")
+    # List of settings to expand first according to topological sort.
+    settings_ordered = topological_sort(graph, starting_nodes)  # type: List[str]
+    # Settings in or after a loop are never reached.
+    if len(settings_ordered) != len(graph):
+        loop = _find_lazy_loop(graph, settings_ordered)
+        raise ValueError("There appears to be a loop of lazy settings: " + " -> ".join(loop))
 
-        # List of settings to expand first according to topological sort.
-        settings_ordered = topological_sort(graph, starting_nodes)  # type: List[str]
+    # Merge in all the metas at once. update_and_expand_meta applies them in the order they were added, so each
+    # one sees the results of the settings it depends on.
+    ordered_metas = {key: lazy_metas[key]
+                     for meta_setting in settings_ordered
+                     for key in (meta_setting, meta_setting + "_meta")}  # type: dict
 
-        def combine_meta(config_dict: dict, meta_setting: str) -> dict:
-            # Merge in the metas in the given order.
-            return update_and_expand_meta(config_dict, {
-                meta_setting: lazy_metas[meta_setting],
-                meta_setting + "_meta": lazy_metas[meta_setting + "_meta"]
-            })
-
-        final_dict = reduce(combine_meta, settings_ordered, expanded_config)  # type: dict
-    else:
-        final_dict = deepdict(expanded_config)
+    final_dict = update_and_expand_meta(expanded_config, ordered_metas)  # type: dict
 
     # Remove any temporary keys.
-    for key in HammerDatabase.internal_keys():
-        if key in final_dict:
-            del final_dict[key]
+    for key in _INTERNAL_KEYS:
+        final_dict.pop(key, None)
 
-    return final_dict
+    return final_dict, lazy_settings
 
 
 def load_config_from_paths(config_paths: Iterable[str], strict: bool = False) -> List[dict]:
@@ -1056,11 +1269,28 @@ def load_config_from_paths(config_paths: Iterable[str], strict: bool = False) ->
     Load configuration from paths containing \*.yml and \*.json files.
     Files specified later in the list take precedence (see combine_configs).
 
+    Set HAMMER_PARALLEL_CONFIG_LOAD=1 to read and parse the files in parallel threads, which can help when loading
+    many files from a slow (e.g. network) filesystem.
+
     :param config_paths: Path to \*.yml and \*.json config files.
     :param strict: Set to true to error if the file is not found.
     :return: A list of configs in order of specification.
     """
-    return list(map(lambda path: load_config_from_file(path, strict), config_paths))
+    paths = list(config_paths)
+    if len(paths) > 1 and os.environ.get("HAMMER_PARALLEL_CONFIG_LOAD", "") == "1":
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            # map() returns the results in the order of the paths.
+            return list(executor.map(lambda path: load_config_from_file(path, strict), paths))
+    return [load_config_from_file(path, strict) for path in paths]
+
+
+@lru_cache(maxsize=1024)
+def _defaults_paths(path: str, base_name: str) -> Tuple[str, str]:
+    """
+    Get the paths to the .json and .yml files with the given base name in path, in the order they are loaded.
+    The same tool/technology folders are loaded repeatedly, so these are cached.
+    """
+    return os.path.join(path, base_name + ".json"), os.path.join(path, base_name + ".yml")
 
 
 def load_config_from_defaults(path: str, strict: bool = False) -> List[dict]:
@@ -1073,10 +1303,7 @@ def load_config_from_defaults(path: str, strict: bool = False) -> List[dict]:
     :param strict: Set to true to error if the file is not found.
     :return: A list of configs in order of specification.
     """
-    return load_config_from_paths([
-        os.path.join(path, "defaults.json"),
-        os.path.join(path, "defaults.yml")
-    ])
+    return load_config_from_paths(_defaults_paths(path, "defaults"))
 
 def load_config_types_from_string(contents: str, is_yaml: bool, path: str = "unspecified") -> dict:
     """
@@ -1109,10 +1336,7 @@ def load_config_types_from_defaults(path: str, strict: bool = False) -> List[dic
     :param strict: Set to true to error if the file is not found.
     :return: A list of configs in order of specification.
     """
-    return load_config_from_paths([
-        os.path.join(path, "defaults_types.json"),
-        os.path.join(path, "defaults_types.yml")
-    ])
+    return load_config_from_paths(_defaults_paths(path, "defaults_types"))
 
 class NamedType(Enum):
     STR = "str"
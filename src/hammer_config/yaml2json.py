@@ -21,6 +21,12 @@ except ImportError:
             sys.path.append(os.environ["HAMMER_PYYAML_PATH"])
             import yaml
 
+# Use the LibYAML-based loader if PyYAML was built with it, since it is much faster.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 import json
 
 def convertArrays(o):
@@ -101,7 +107,7 @@ def load_yaml(yamlStr: str) -> dict:
     :param yamlStr: A string containing the yaml database.
     :return: A dictionary object representing the yaml database.
     """
-    obj = convertArrays(yaml.safe_load(yamlStr))
+    obj = convertArrays(yaml.load(yamlStr, Loader=SafeLoader))
     # Note we are not using HammerJSONEncoder here to avoid a circular dependency, but this should never need have Decimals
     obj2 = json.loads(json.dumps(obj))
     if not compare(obj, obj2):
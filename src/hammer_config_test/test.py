@@ -5,10 +5,13 @@
 #
 #  See LICENSE for licence details.
 
+import json
 import os
 import tempfile
+import time
 import unittest
 import warnings
+from decimal import Decimal
 
 import hammer_config
 
@@ -71,6 +74,94 @@ a.b.c_meta: append
         db.update_environment([])
         self.assertEqual(db.get_setting("a.b.c", check_type=False), ["test"])
 
+    def test_database_json_updates(self) -> None:
+        """
+        Test that the JSON dump of the database follows changes to the database.
+        """
+        db = hammer_config.HammerDatabase()
+        db.update_core([hammer_config.load_config_from_string("key1: value1", is_yaml=True)])
+        self.assertIn('"key1": "value1"', db.get_database_json())
+        self.assertIs(db.get_database_json(), db.get_database_json())
+        db.set_setting("key1", "value2")
+        self.assertIn('"key1": "value2"', db.get_database_json())
+        db.update_project([hammer_config.load_config_from_string("key3: value3", is_yaml=True)])
+        self.assertIn('"key3": "value3"', db.get_database_json())
+
+    def test_database_json_contents(self) -> None:
+        """
+        Test that the JSON dump of the database can be read back, including values which need special handling.
+        """
+        db = hammer_config.HammerDatabase()
+        db.update_core([hammer_config.load_config_from_string("key1: value1", is_yaml=True)])
+        db.set_setting("key2", Decimal("1.5"))
+        db.set_setting("key3", [1, {"nested": True}])
+        expected = {"key1": "value1", "key2": 1.5, "key3": [1, {"nested": True}]}
+        self.assertEqual(json.loads(db.get_database_json()), expected)
+        # Too big for some JSON libraries.
+        db.set_setting("key4", 2 ** 70)
+        expected["key4"] = 2 ** 70
+        self.assertEqual(json.loads(db.get_database_json()), expected)
+        # Non-finite numbers are kept, not turned into null.
+        db.set_setting("key5", [float("nan"), float("inf"), Decimal("-Infinity")])
+        dumped = db.get_database_json()
+        self.assertIn("NaN", dumped)
+        self.assertIn("Infinity", dumped)
+        self.assertIn("-Infinity", dumped)
+        self.assertNotIn("null", dumped)
+        # Dumped with json, which keeps its usual indentation.
+        self.assertIn('\n    "key1": "value1"', dumped)
+
+    def test_setting_cache_updates(self) -> None:
+        """
+        Test that get_setting follows changes to the database after a lookup.
+        """
+        db = hammer_config.HammerDatabase()
+        db.update_core([hammer_config.load_config_from_string("key1: value1", is_yaml=True)])
+        self.assertEqual(db.get_setting("key1", check_type=False), "value1")
+        db.update_project([hammer_config.load_config_from_string("key1: value2", is_yaml=True)])
+        self.assertEqual(db.get_setting("key1", check_type=False), "value2")
+        db.set_setting("key1", "value3")
+        self.assertEqual(db.get_setting("key1", check_type=False), "value3")
+        with self.assertRaises(KeyError):
+            db.get_setting("key2", check_type=False)
+
+    def test_untyped_setting_warns(self) -> None:
+        """
+        Test that every type-checked lookup of a setting without a type warns, even though lookups are cached.
+        """
+        db = hammer_config.HammerDatabase()
+        db.update_core([hammer_config.load_config_from_string("key1: value1", is_yaml=True)])
+        for _ in range(2):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.assertEqual(db.get_setting("key1"), "value1")
+            self.assertEqual([str(w.message) for w in caught], ["Key key1 is not associated with a type"])
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertEqual(db.get_setting("key1", check_type=False), "value1")
+        self.assertEqual(caught, [])
+
+    def test_set_setting_lazy_dependents(self) -> None:
+        """
+        Test that set_setting updates lazy settings which depend on the changed setting.
+        """
+        db = hammer_config.HammerDatabase()
+        db.update_core([hammer_config.load_config_from_string("""
+foo: "hello"
+bar: "${foo} world"
+bar_meta: lazysubst
+baz: "unrelated"
+""", is_yaml=True)])
+        config = db.get_config()
+        self.assertEqual(db.get_setting("bar", check_type=False), "hello world")
+        db.set_setting("baz", "changed")
+        self.assertEqual(db.get_setting("baz", check_type=False), "changed")
+        self.assertEqual(config["baz"], "unrelated")
+        db.set_setting("foo", "goodbye")
+        self.assertEqual(db.get_setting("bar", check_type=False), "goodbye world")
+        db.set_setting("bar", "${baz}")
+        self.assertEqual(db.get_setting("bar", check_type=False), "changed")
+
     def test_no_json_yaml_precedence(self) -> None:
         """
         Test that neither JSON nor YAML take precedence over each other.
@@ -97,6 +188,61 @@ foo.bar: "i'm yaml"
         db2.update_core([hammer_config.combine_configs(configs)])
         self.assertEqual(db2.get_setting("foo.bar", check_type=False), "i'm yaml")
 
+    def test_parallel_config_load(self) -> None:
+        """
+        Test that configs loaded in parallel keep the order of the paths given.
+        """
+        paths = []
+        for i in range(10):
+            fd, path = tempfile.mkstemp(".yml")
+            with os.fdopen(fd, 'w') as f:
+                f.write(f"foo.bar: {i}")
+            paths.append(path)
+        os.environ["HAMMER_PARALLEL_CONFIG_LOAD"] = "1"
+        try:
+            configs = hammer_config.load_config_from_paths(paths)
+        finally:
+            del os.environ["HAMMER_PARALLEL_CONFIG_LOAD"]
+        self.assertEqual([config["foo.bar"] for config in configs], list(range(10)))
+        for path in paths:
+            os.remove(path)
+
+    def test_config_file_cache(self) -> None:
+        """
+        Test that cached config files are not shared between callers and are reloaded when changed.
+        """
+        fd, path = tempfile.mkstemp(".yml")
+        os.close(fd)
+        with open(path, 'w') as f:
+            f.write("foo.bar: 1")
+        # Make the file old enough to be cached.
+        os.utime(path, (time.time() - 100, time.time() - 100))
+        config = hammer_config.load_config_from_file(path)
+        self.assertEqual(config["foo.bar"], 1)
+        config["foo.bar"] = 2
+        self.assertEqual(hammer_config.load_config_from_file(path)["foo.bar"], 1)
+
+        with open(path, 'w') as f:
+            f.write("foo.bar: 10")
+        self.assertEqual(hammer_config.load_config_from_file(path)["foo.bar"], 10)
+        os.remove(path)
+
+    def test_json_config_numbers(self) -> None:
+        """
+        Test that numbers in JSON configs are loaded exactly, including ones which don't fit in 64 bits.
+        """
+        config = hammer_config.load_config_from_string("""
+{
+    "foo.small": 42,
+    "foo.big": 1180591620717411303424,
+    "foo.float": 1.5
+}
+""", is_yaml=False)
+        self.assertEqual(config["foo.small"], 42)
+        self.assertEqual(config["foo.big"], 2 ** 70)
+        self.assertIsInstance(config["foo.big"], int)
+        self.assertEqual(config["foo.float"], 1.5)
+
     def test_meta_json2list(self) -> None:
         """
         Test that the meta attribute "json2list" works.
@@ -164,6 +310,32 @@ foo:
         self.assertEqual(db.get_setting("foo.pipeline", check_type=False), "yesman")
         self.assertEqual(db.get_setting("foo.uint", check_type=False), ["1", "2"])
 
+    def test_meta_subst_list(self) -> None:
+        """
+        Test that "subst" on lists keeps every element separate, including empty lists
+        and elements which contain the NUL character.
+        """
+        db = hammer_config.HammerDatabase()
+        base = hammer_config.load_config_from_string("""
+foo:
+    one: "1"
+    two: "2"
+""", is_yaml=True)
+        meta = hammer_config.load_config_from_string("""
+{
+  "foo.uint": ["${foo.one}", "", "${foo.one}${foo.two}"],
+  "foo.uint_meta": "subst",
+  "foo.empty": [],
+  "foo.empty_meta": "subst",
+  "foo.nul": ["${foo.one}\\u0000", "${foo.two}"],
+  "foo.nul_meta": "subst"
+}
+""", is_yaml=False)
+        db.update_core([base, meta])
+        self.assertEqual(db.get_setting("foo.uint", check_type=False), ["1", "", "12"])
+        self.assertEqual(db.get_setting("foo.empty", check_type=False), [])
+        self.assertEqual(db.get_setting("foo.nul", check_type=False), ["1\x00", "2"])
+
     def test_meta_lazysubst(self) -> None:
         """
         Test that the meta attribute "lazysubst" works.
@@ -239,6 +411,38 @@ foo:
         self.assertEqual(db.get_setting("foo.bar.dac", check_type=False), "current_weighted")
         self.assertEqual(db.get_setting("foo.bar.dsl", check_type=False), ["scala", "python"])
 
+    def test_meta_result_not_shared_with_input(self) -> None:
+        """
+        Test that modifying a combined config does not modify the configs it was combined from.
+        """
+        base = {"a": [{"x": 0}]}
+        meta = {"a": [{"x": 1}], "a_meta": "append", "b": {"y": [2]}, "c": [{"z": 3}], "c_meta": ["append"]}
+        combined = hammer_config.combine_configs([base, meta])
+        self.assertEqual(combined["a"], [{"x": 0}, {"x": 1}])
+        combined["a"][0]["x"] = 10
+        combined["a"][1]["x"] = 11
+        combined["b"]["y"].append(12)
+        combined["c"][0]["z"] = 13
+        self.assertEqual(base, {"a": [{"x": 0}]})
+        self.assertEqual(meta["a"], [{"x": 1}])
+        self.assertEqual(meta["b"], {"y": [2]})
+        self.assertEqual(meta["c"], [{"z": 3}])
+
+    def test_lazy_meta_result_not_shared_with_input(self) -> None:
+        """
+        Test that modifying a combined config with lazy settings does not modify the configs it was combined from.
+        """
+        base = {"a": [{"x": 0}], "b": {"y": [1]}}
+        meta = {"a": [{"x": 2}], "a_meta": "lazyappend", "c": "b", "c_meta": "lazycrossref"}
+        combined = hammer_config.combine_configs([base, meta])
+        self.assertEqual(combined["a"], [{"x": 0}, {"x": 2}])
+        self.assertEqual(combined["c"], {"y": [1]})
+        combined["a"][0]["x"] = 10
+        combined["a"][1]["x"] = 12
+        combined["c"]["y"].append(11)
+        self.assertEqual(base, {"a": [{"x": 0}], "b": {"y": [1]}})
+        self.assertEqual(meta["a"], [{"x": 2}])
+
     def test_meta_crossappend(self) -> None:
         """
         Test that the meta attribute "crossappend" works.
@@ -571,6 +775,31 @@ test_meta: ["lazysubst", "lazycrossref"]
         msg = cm.exception.args[0]
         self.assertTrue("Multiple lazy directives in a single directive array not supported yet" in msg)
 
+    def test_lazy_loop(self) -> None:
+        """
+        Test that loops of lazy settings are caught, even when other lazy settings don't depend on the loop.
+        """
+        config = hammer_config.load_config_from_string("""
+{
+  "free": "free",
+  "free_meta": "lazysubst",
+  "a": "${b}",
+  "a_meta": "lazysubst",
+  "b": "${a}",
+  "b_meta": "lazysubst"
+}
+""", is_yaml=False)
+        with self.assertRaises(ValueError) as cm:
+            hammer_config.combine_configs([config])
+        self.assertIn("loop of lazy settings: a -> b -> a", cm.exception.args[0])
+
+        # Loops with no lazy settings outside of them.
+        del config["free"]
+        del config["free_meta"]
+        with self.assertRaises(ValueError) as cm:
+            hammer_config.combine_configs([config])
+        self.assertIn("loop of lazy settings: a -> b -> a", cm.exception.args[0])
+
     def test_meta_append_bad(self) -> None:
         """
         Test that the meta attribute "append" catches bad inputs.
@@ -674,6 +903,23 @@ foo:
         self.assertEqual(db.get_setting("foo.twelve", check_type=False), "whatever")
         self.assertEqual(db.get_setting("later", check_type=False), "whatever")
 
+    def test_meta_lazysubst_self_reference_with_others(self) -> None:
+        """
+        Check that a lazysubst which references itself keeps its other references intact.
+        """
+        db = hammer_config.HammerDatabase()
+        base = hammer_config.load_config_from_string("""
+foo: "hello"
+bar: "world"
+""", is_yaml=True)
+        project = hammer_config.load_config_from_string("""
+foo: "${foo} ${bar}"
+foo_meta: lazysubst
+""", is_yaml=True)
+        db.update_core([base])
+        db.update_project([project])
+        self.assertEqual(db.get_setting("foo", check_type=False), "hello world")
+
     def test_meta_lazycrossappendref(self) -> None:
         """
         Test that lazy crossappendref works.